@@ -4,6 +4,7 @@ Centralized configuration management for scrapers, database, and API
 """
 
 import os
+import re
 from typing import List, Dict
 
 # =============================================================================
@@ -40,6 +41,15 @@ REQUEST_TIMEOUT = 10  # seconds
 MAX_RETRIES = 3
 RETRY_BACKOFF_FACTOR = 2  # exponential backoff: 2^attempt seconds
 RATE_LIMIT_DELAY = 1  # seconds between requests
+MAX_CONCURRENT_REQUESTS = 4  # race pages fetched together per rate-limited batch
+
+# On-disk HTTP cache for race pages (used when requests-cache is installed)
+HTTP_CACHE_NAME = "logs/http_cache"  # SQLite file, ".sqlite" is appended
+HTTP_CACHE_EXPIRE = 86400  # seconds before a cached page is revalidated
+
+# Worker processes used to parse race pages while the next page is fetched;
+# more than the concurrent fetches could keep busy would sit idle
+PARSE_WORKERS = min(os.cpu_count() or 1, MAX_CONCURRENT_REQUESTS)
 
 # User agent for requests
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -47,6 +57,7 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 # Safety limits
 MAX_PAGES = 110  # prevent infinite loops in pagination
 MAX_RACES_PER_SESSION = 1500  # reasonable limit for scraping
+MAX_PAGES_WITHOUT_NEW_RACES = 2  # stop paginating once listing pages only show stored races
 
 # =============================================================================
 # HTML SELECTORS AND PATTERNS
@@ -88,15 +99,15 @@ RESULTS_TABLE_SELECTORS = [
 
 # French date patterns (most common format)
 FRENCH_DATE_PATTERNS = [
-    r'(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})',
-    r'(\d{1,2}\s+(?:jan|fév|mar|avr|mai|juin|juil|août|sept|oct|nov|déc)\s+\d{4})',
+    re.compile(r'(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})', re.IGNORECASE),
+    re.compile(r'(\d{1,2}\s+(?:jan|fév|mar|avr|mai|juin|juil|août|sept|oct|nov|déc)\s+\d{4})', re.IGNORECASE),
 ]
 
 # Generic date patterns (fallback)
 GENERIC_DATE_PATTERNS = [
-    r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
-    r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})',
-    r'(\d{1,2}\s+\w+\s+\d{4})'
+    re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})'),
+    re.compile(r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})'),
+    re.compile(r'(\d{1,2}\s+\w+\s+\d{4})')
 ]
 
 # Default fallback date
@@ -111,7 +122,7 @@ MIN_PARTICIPANT_CELLS = 4
 MIN_RAW_DATA_LENGTH = 4
 
 # Header-like entries to skip
-HEADER_KEYWORDS = ['nom', 'name', 'coureur', 'rider', 'prenom']
+HEADER_KEYWORDS = frozenset({'nom', 'name', 'coureur', 'rider', 'prenom'})  # lowercase
 
 # Club name cleaning pattern
 CLUB_NUMBER_PATTERN = r'^\d+\s*'
@@ -166,6 +177,10 @@ LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Log file buffering
+LOG_FILE_BUFFER_SIZE = 64 * 1024  # bytes
+LOG_FLUSH_INTERVAL = 0.5  # seconds between log file flushes
+
 # =============================================================================
 # RACE ID GENERATION
 # =============================================================================
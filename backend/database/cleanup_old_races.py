@@ -24,6 +24,12 @@ sys.path.append(project_root)
 # Import configuration
 from backend.config.constants import DEFAULT_DB_PATH
 
+# Pattern: day month year (e.g., "25 mai 2024")
+_FRENCH_DATE_RE = re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})', re.IGNORECASE)
+
+# Race IDs bound per "IN (...)" query, under SQLite's default limit of 999 host parameters
+_IDS_PER_QUERY = 900
+
 
 class RaceCleanupScript:
     """Script to cleanup old races from the database"""
@@ -69,9 +75,7 @@ class RaceCleanupScript:
         if not date_string or date_string.strip() == "" or date_string == "Date inconnue":
             return None
 
-        # Pattern: day month year (e.g., "25 mai 2024")
-        pattern = r'(\d{1,2})\s+(\w+)\s+(\d{4})'
-        match = re.match(pattern, date_string.strip(), re.IGNORECASE)
+        match = _FRENCH_DATE_RE.match(date_string.strip())
 
         if not match:
             print(f"Warning: Could not parse date '{date_string}'")
@@ -101,19 +105,20 @@ class RaceCleanupScript:
             List of tuples (race_id, date, name) for old races
         """
         old_races = []
+        is_old_by_date = {}  # many races share a date, so each date string is parsed once
 
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
-            # Get all races
-            cursor.execute("SELECT id, date, name FROM races")
-            races = cursor.fetchall()
-
-            for race_id, date_str, name in races:
-                race_date = self.parse_french_date(date_str)
+            # Stream all races from the cursor instead of materializing them first
+            for race_id, date_str, name in cursor.execute("SELECT id, date, name FROM races"):
+                is_old = is_old_by_date.get(date_str)
+                if is_old is None:
+                    race_date = self.parse_french_date(date_str)
+                    is_old = is_old_by_date[date_str] = bool(race_date and race_date < self.cutoff_date)
 
-                if race_date and race_date < self.cutoff_date:
+                if is_old:
                     old_races.append((race_id, date_str, name))
 
             conn.close()
@@ -141,10 +146,14 @@ class RaceCleanupScript:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
-            # Count race results that will be deleted
-            placeholders = ','.join(['?' for _ in race_ids])
-            cursor.execute(f"SELECT COUNT(*) FROM race_results WHERE race_id IN ({placeholders})", race_ids)
-            result_count = cursor.fetchone()[0]
+            # Count race results that will be deleted, only looking up the races
+            # being deleted through the race_id index, a chunk of IDs per query
+            result_count = 0
+            for start in range(0, len(race_ids), _IDS_PER_QUERY):
+                chunk = race_ids[start:start + _IDS_PER_QUERY]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"SELECT COUNT(*) FROM race_results WHERE race_id IN ({placeholders})", chunk)
+                result_count += cursor.fetchone()[0]
 
             conn.close()
 
@@ -177,13 +186,17 @@ class RaceCleanupScript:
 
         try:
             conn = sqlite3.connect(self.db_path)
+            # Foreign keys are off by default in SQLite; enable them on this connection
+            # only so deleting a race cascades to its race_results (ON DELETE CASCADE).
+            # They stay off for the scrapers, where INSERT OR REPLACE on cyclists
+            # would cascade to the cyclist's results.
+            conn.execute("PRAGMA foreign_keys = ON")
             cursor = conn.cursor()
 
-            # Delete races (results will be deleted automatically via CASCADE)
-            placeholders = ','.join(['?' for _ in race_ids])
-            cursor.execute(f"DELETE FROM races WHERE id IN ({placeholders})", race_ids)
-
+            # Delete races (results are deleted by the cascade) in a single transaction
+            cursor.executemany("DELETE FROM races WHERE id = ?", [(race_id,) for race_id in race_ids])
             deleted_count = cursor.rowcount
+
             conn.commit()
             conn.close()
 
@@ -5,18 +5,30 @@ Migration script to convert existing YAML data to SQLite database
 
 import yaml
 import os
+from functools import lru_cache
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from backend.database.models import CyclingDatabase
 import re
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml, use the pure-Python loader
+    from yaml import SafeLoader
 
+# Participants buffered before writing cyclists and results in bulk
+BATCH_SIZE = 5000
+
+_LEADING_NUM_RE = re.compile(r'^\d+\s*')
+
+
+@lru_cache(maxsize=4096)
 def clean_club_name(club_raw):
     """Remove leading numbers from club names"""
     if not club_raw:
         return None
     # Remove leading numbers and spaces
-    cleaned = re.sub(r'^\d+\s*', '', club_raw.strip())
+    cleaned = _LEADING_NUM_RE.sub('', club_raw.strip())
     return cleaned if cleaned else club_raw
 
 
@@ -33,7 +45,7 @@ def migrate_yaml_to_database(yaml_file='public/data.yaml', db_path='database/cyc
     # Load YAML data
     print("Loading YAML data...")
     with open(yaml_file, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
     
     # Initialize database
     print("Initializing database...")
@@ -55,60 +67,63 @@ def migrate_yaml_to_database(yaml_file='public/data.yaml', db_path='database/cyc
     race_count = 0
     cyclist_count = 0
     result_count = 0
+    cyclist_rows = {}  # uci_id -> latest cyclist row, cyclists recur across races
+    result_rows = []
     
-    for race_id, race_info in races_data.items():
-        # Add race
-        db.add_or_update_race(
-            race_id=race_id,
-            date=race_info['date'],
-            name=race_info['name']
-        )
-        race_count += 1
-        
-        # Process participants
-        participants = race_info.get('participants', [])
-        for participant in participants:
-            uci_id = participant['name']  # UCI ID stored in 'name' field
-            rank = participant['rank']
-            raw_data = participant.get('raw_data', [])
+    # Load everything in a single transaction
+    with db.write_transaction(bulk=True) as conn:
+        for race_id, race_info in races_data.items():
+            # Add race
+            db.add_or_update_race(
+                race_id=race_id,
+                date=race_info['date'],
+                name=race_info['name'],
+                conn=conn
+            )
+            race_count += 1
             
-            # Extract cyclist info from raw_data
-            if len(raw_data) >= 5:
-                first_name = raw_data[3] if len(raw_data) > 3 else ''
-                last_name = raw_data[2] if len(raw_data) > 2 else ''
-                region = raw_data[4] if len(raw_data) > 4 else ''
-                club_raw = raw_data[5] if len(raw_data) > 5 else ''
-                club_clean = clean_club_name(club_raw)
+            # Process participants
+            participants = race_info.get('participants', [])
+            for participant in participants:
+                uci_id = participant.get('name')  # UCI ID stored in 'name' field
                 
-                # Add or update cyclist
+                # Build the rows of each participant on its own, so a malformed
+                # entry is skipped instead of aborting the whole transaction
                 try:
-                    db.add_or_update_cyclist(
-                        uci_id=uci_id,
-                        first_name=first_name,
-                        last_name=last_name,
-                        region=region,
-                        club=club_clean,
-                        club_raw=club_raw
-                    )
-                    cyclist_count += 1
+                    rank = participant['rank']
+                    raw_data = participant.get('raw_data', [])
+                    
+                    # Extract cyclist info from raw_data
+                    if len(raw_data) < 5:
+                        continue
+                    first_name = raw_data[3] if len(raw_data) > 3 else ''
+                    last_name = raw_data[2] if len(raw_data) > 2 else ''
+                    region = raw_data[4] if len(raw_data) > 4 else ''
+                    club_raw = raw_data[5] if len(raw_data) > 5 else ''
+                    club_clean = clean_club_name(club_raw)
+                    
+                    cyclist_row = (uci_id, first_name, last_name, region, club_clean, club_raw)
+                    result_row = (race_id, uci_id, rank, None, db.dump_raw_data(raw_data))
+                    
+                    # Queue cyclist and race result for the next bulk write
+                    cyclist_rows[uci_id] = cyclist_row
                 except Exception as e:
-                    print(f"Error adding cyclist {uci_id}: {e}")
+                    print(f"Error processing participant {uci_id} in {race_id}: {e}")
                     continue
-                
-                # Add race result
-                try:
-                    db.add_race_result(
-                        race_id=race_id,
-                        uci_id=uci_id,
-                        rank=rank,
-                        raw_data=raw_data
-                    )
-                    result_count += 1
-                except Exception as e:
-                    print(f"Error adding race result for {uci_id} in {race_id}: {e}")
+                result_rows.append(result_row)
+            
+            if len(result_rows) >= BATCH_SIZE:
+                cyclist_count += db.add_cyclists_bulk(list(cyclist_rows.values()), conn=conn)
+                result_count += db.add_results_bulk(result_rows, conn=conn)
+                cyclist_rows.clear()
+                result_rows.clear()
+            
+            if race_count % 10 == 0:
+                print(f"Processed {race_count} races...")
         
-        if race_count % 10 == 0:
-            print(f"Processed {race_count} races...")
+        # Write the remaining participants
+        cyclist_count += db.add_cyclists_bulk(list(cyclist_rows.values()), conn=conn)
+        result_count += db.add_results_bulk(result_rows, conn=conn)
     
     print(f"\nMigration completed!")
     print(f"- Races migrated: {race_count}")
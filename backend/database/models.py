@@ -7,20 +7,62 @@ import sqlite3
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, raw data is then serialized with json
+    orjson = None
+
 
 class CyclingDatabase:
+    # Hot insert statements kept as constant strings so sqlite3 reuses their prepared form
+    INSERT_CYCLIST_SQL = """
+        INSERT OR REPLACE INTO cyclists
+        (uci_id, first_name, last_name, region, club, club_raw, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    """
+    INSERT_RACE_RESULT_SQL = """
+        INSERT OR REPLACE INTO race_results
+        (race_id, uci_id, rank, race_participant_count, raw_data_json)
+        VALUES (?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str = "backend/database/cycling_data.db"):
         self.db_path = db_path
         self.ensure_database_exists()
     
+    @staticmethod
+    def _load_raw_data(row: Dict) -> List:
+        """
+        Pop raw_data_json from a result row and decode it
+
+        Results saved without raw data get it rebuilt from the normalized columns
+        in the scraped table order: [rank, uci_id, last_name, first_name, region, club].
+        """
+        raw_data_json = row.pop('raw_data_json')
+        if raw_data_json is not None:
+            return json.loads(raw_data_json)
+        return [str(row.get('rank', '')), row.get('uci_id') or '', row.get('last_name') or '',
+                row.get('first_name') or '', row.get('region') or '', row.get('club_raw') or '']
+    
+    @staticmethod
+    def dump_raw_data(raw_data: List) -> str:
+        """Serialize a raw_data row to compact JSON for raw_data_json"""
+        if orjson is not None:
+            return orjson.dumps(raw_data).decode('utf-8')
+        return json.dumps(raw_data, ensure_ascii=False, separators=(',', ':'))
+    
     def ensure_database_exists(self):
         """Create database and tables if they don't exist"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         with self.get_connection() as conn:
+            # Write-Ahead Logging is stored in the database file, so it is set once here.
+            # Readers (the API) then no longer block on scraper writes.
+            conn.execute("PRAGMA journal_mode = WAL")
+            
             # Read and execute schema
             schema_path = os.path.join(os.path.dirname(__file__), "schema.sql")
             if os.path.exists(schema_path):
@@ -33,6 +75,9 @@ class CyclingDatabase:
         """Context manager for database connections"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row  # Enable dict-like access
+        # Per-connection settings: with WAL, NORMAL only syncs at checkpoints
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA mmap_size = 268435456")  # Read pages through the OS cache
         try:
             yield conn
             conn.commit()
@@ -42,6 +87,33 @@ class CyclingDatabase:
         finally:
             conn.close()
     
+    @contextmanager
+    def write_transaction(self, bulk: bool = False):
+        """
+        Context manager for a connection holding a single write transaction
+
+        The write lock is taken up front (BEGIN IMMEDIATE) and everything done on
+        the connection is committed together on exit, or rolled back on error.
+
+        Args:
+            bulk: Also enlarge caches for large one-off loads
+        """
+        with self.get_connection() as conn:
+            if bulk:
+                conn.execute("PRAGMA temp_store = MEMORY")
+                conn.execute("PRAGMA cache_size = -200000")
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+    
+    @contextmanager
+    def _connection(self, conn: Optional[sqlite3.Connection] = None):
+        """Use the caller's connection, or open one committed on exit"""
+        if conn is not None:
+            yield conn
+        else:
+            with self.get_connection() as new_conn:
+                yield new_conn
+    
     def update_scraping_info(self, total_races: int, total_racers: int) -> None:
         """Update scraping metadata"""
         with self.get_connection() as conn:
@@ -59,9 +131,10 @@ class CyclingDatabase:
             """).fetchone()
             return dict(row) if row else None
     
-    def add_or_update_race(self, race_id: str, date: str, name: str) -> None:
-        """Add or update a race"""
-        with self.get_connection() as conn:
+    def add_or_update_race(self, race_id: str, date: str, name: str,
+                           conn: Optional[sqlite3.Connection] = None) -> None:
+        """Add or update a race, on the given connection if any"""
+        with self._connection(conn) as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO races (id, date, name, updated_at)
                 VALUES (?, ?, ?, CURRENT_TIMESTAMP)
@@ -71,20 +144,104 @@ class CyclingDatabase:
                              region: str = None, club: str = None, club_raw: str = None) -> None:
         """Add or update cyclist information"""
         with self.get_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO cyclists 
-                (uci_id, first_name, last_name, region, club, club_raw, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (uci_id, first_name, last_name, region, club, club_raw))
+            conn.execute(self.INSERT_CYCLIST_SQL,
+                         (uci_id, first_name, last_name, region, club, club_raw))
     
     def add_race_result(self, race_id: str, uci_id: str, rank: int, raw_data: List, race_participant_count: int = None) -> None:
         """Add a race result"""
         with self.get_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO race_results
-                (race_id, uci_id, rank, race_participant_count, raw_data_json)
-                VALUES (?, ?, ?, ?, ?)
-            """, (race_id, uci_id, rank, race_participant_count, json.dumps(raw_data)))
+            conn.execute(self.INSERT_RACE_RESULT_SQL,
+                         (race_id, uci_id, rank, race_participant_count, self.dump_raw_data(raw_data)))
+    
+    def add_race_participants(self, race_id: str, participants: List[Dict],
+                              race_participant_count: int = None,
+                              conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Add cyclists and their results for a race in a single transaction
+
+        Both tables are written with executemany. Rows that fail to insert are
+        skipped without aborting the others.
+        Participants without 'raw_data' are stored without it.
+        Runs on the given connection if any (see write_transaction).
+        Returns the number of participants added.
+        """
+        cyclist_rows = []
+        result_rows = []
+        for participant in participants:
+            cyclist_rows.append((
+                participant['uci_id'], participant['first_name'], participant['last_name'],
+                participant['region'], participant['club_clean'], participant['club_raw']
+            ))
+            result_rows.append((
+                race_id, participant['uci_id'], participant['rank'],
+                race_participant_count,
+                self.dump_raw_data(participant['raw_data']) if participant.get('raw_data') is not None else None
+            ))
+        
+        with self._connection(conn) as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            self._insert_many(conn, self.INSERT_CYCLIST_SQL, cyclist_rows)
+            return self._insert_many(conn, self.INSERT_RACE_RESULT_SQL, result_rows)
+    
+    def add_cyclists_bulk(self, rows: List[Tuple], conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Add or update many cyclists in one transaction
+
+        Args:
+            rows: (uci_id, first_name, last_name, region, club, club_raw) tuples
+            conn: Optional connection to run on (see write_transaction)
+
+        Returns:
+            Number of cyclists written
+        """
+        with self._connection(conn) as conn:
+            return self._insert_many(conn, self.INSERT_CYCLIST_SQL, rows)
+    
+    def add_results_bulk(self, rows: List[Tuple], conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Add many race results in one transaction
+
+        Args:
+            rows: (race_id, uci_id, rank, race_participant_count, raw_data_json) tuples,
+                with raw_data already serialized to JSON (or None)
+            conn: Optional connection to run on (see write_transaction)
+
+        Returns:
+            Number of results written
+        """
+        with self._connection(conn) as conn:
+            return self._insert_many(conn, self.INSERT_RACE_RESULT_SQL, rows)
+    
+    @staticmethod
+    def _insert_many(conn: sqlite3.Connection, sql: str, rows: List[Tuple]) -> int:
+        """
+        Run an insert for all rows with executemany
+
+        If any row fails, the batch is rolled back to a savepoint and retried row
+        by row so that only the failing rows are skipped.
+        Returns the number of rows inserted.
+        """
+        if not rows:
+            return 0
+        
+        conn.execute("SAVEPOINT insert_many")
+        try:
+            conn.executemany(sql, rows)
+            conn.execute("RELEASE insert_many")
+            return len(rows)
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO insert_many")
+            conn.execute("RELEASE insert_many")
+        
+        inserted = 0
+        for row in rows:
+            try:
+                conn.execute(sql, row)
+                inserted += 1
+            except sqlite3.Error:
+                continue
+        return inserted
     
     def race_exists(self, race_id: str) -> bool:
         """Check if race already exists"""
@@ -92,6 +249,12 @@ class CyclingDatabase:
             row = conn.execute("SELECT 1 FROM races WHERE id = ?", (race_id,)).fetchone()
             return row is not None
     
+    def get_all_race_ids(self) -> Set[str]:
+        """Get the IDs of all races already stored"""
+        with self.get_connection() as conn:
+            rows = conn.execute("SELECT id FROM races").fetchall()
+            return {row[0] for row in rows}
+    
     def get_all_races(self) -> List[Dict]:
         """Get all races with participant data"""
         with self.get_connection() as conn:
@@ -130,14 +293,13 @@ class CyclingDatabase:
             race['participants'] = []
             for row in participant_rows:
                 participant = dict(row)
-                participant['raw_data'] = json.loads(participant['raw_data_json'])
-                del participant['raw_data_json']
+                participant['raw_data'] = self._load_raw_data(participant)
                 race['participants'].append(participant)
             
             return race
     
     def get_cyclist_history(self, uci_id: str) -> List[Dict]:
-        """Get all race results for a specific cyclist"""
+        """Get all race results for a specific cyclist, raw_data is None when it was not stored"""
         with self.get_connection() as conn:
             rows = conn.execute("""
                 SELECT r.id as race_id, r.date, r.name as race_name,
@@ -148,11 +310,13 @@ class CyclingDatabase:
                 ORDER BY r.date DESC
             """, (uci_id,)).fetchall()
 
+            # Results saved without raw data keep raw_data as None: the cyclist's
+            # current name and club may differ from the ones at race time
             history = []
             for row in rows:
                 result = dict(row)
-                result['raw_data'] = json.loads(result['raw_data_json'])
-                del result['raw_data_json']
+                raw_data_json = result.pop('raw_data_json')
+                result['raw_data'] = json.loads(raw_data_json) if raw_data_json is not None else None
                 history.append(result)
 
             return history
@@ -235,7 +399,7 @@ class CyclingDatabase:
                 participants = []
                 for p_row in participant_rows:
                     p_dict = dict(p_row)
-                    raw_data = json.loads(p_dict['raw_data_json'])
+                    raw_data = self._load_raw_data(p_dict)
                     participants.append({
                         'name': p_dict['uci_id'],
                         'rank': p_dict['rank'],
@@ -15,6 +15,15 @@ import sys
 import os
 from collections import defaultdict
 
+# Patterns used for every race page and participant row
+_WS_RE = re.compile(r'\s+')
+_FIRST_INT_RE = re.compile(r'\d+')
+_DATE_PATTERNS = (
+    re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})'),
+    re.compile(r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})'),
+    re.compile(r'(\d{1,2}\s+\w+\s+\d{4})')
+)
+
 class CyclingScraper:
     def __init__(self, existing_data_file='public/data.yaml'):
         self.base_url = "https://paysdelaloirecyclisme.fr"
@@ -67,7 +76,7 @@ class CyclingScraper:
     def generate_race_key(self, name, date):
         """Generate a unique key for race identification"""
         # Normalize name and date for comparison
-        normalized_name = re.sub(r'\s+', ' ', name.strip().upper()) if name else ''
+        normalized_name = _WS_RE.sub(' ', name.strip().upper()) if name else ''
         normalized_date = date.strip() if date else ''
         return f"{normalized_name}|{normalized_date}"
     
@@ -115,13 +124,8 @@ class CyclingScraper:
             if date_elem:
                 date_text = date_elem.get_text().strip()
                 # Try to parse various date formats
-                date_patterns = [
-                    r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
-                    r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})',
-                    r'(\d{1,2}\s+\w+\s+\d{4})'
-                ]
-                for pattern in date_patterns:
-                    match = re.search(pattern, date_text)
+                for pattern in _DATE_PATTERNS:
+                    match = pattern.search(date_text)
                     if match:
                         return match.group(1)
         
@@ -182,11 +186,11 @@ class CyclingScraper:
                 name_text = cells[1].get_text().strip()
                 
                 # Clean up rank (remove non-numeric characters except for numbers)
-                rank_match = re.search(r'\d+', rank_text)
+                rank_match = _FIRST_INT_RE.search(rank_text)
                 rank = int(rank_match.group()) if rank_match else len(participants) + 1
                 
                 # Clean up name
-                name = re.sub(r'\s+', ' ', name_text).strip()
+                name = _WS_RE.sub(' ', name_text).strip()
                 
                 if name and name.lower() not in ['nom', 'name', 'coureur', 'rider']:
                     participant = {
@@ -4,30 +4,68 @@ Cycling Results Scraper for Pays de la Loire - Database Version
 Scrapes race results and saves directly to SQLite database
 """
 
+import hashlib
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
+import threading
 import time
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from backend.database.models import CyclingDatabase
+from backend.config.constants import (
+    FRENCH_DATE_PATTERNS, GENERIC_DATE_PATTERNS, MAX_CONCURRENT_REQUESTS, RATE_LIMIT_DELAY, USER_AGENT,
+    MAX_PAGES_WITHOUT_NEW_RACES, HTTP_CACHE_NAME
+)
+from backend.utils.scraper_utils import (
+    clean_club_name, normalize_text, is_header_entry, extract_rank, create_session, BS4_PARSER
+)
+
+
+# CSS selectors compiled once, tried in priority order on every page
+# Date: race header first, then other date elements (sometimes the date is in the title)
+_DATE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    '.header-race__date',
+    '.race-date',
+    '.date',
+    '[class*="date"]',
+    'time',
+    '.event-date',
+    'h1', 'h2', 'h3',
+    '.card-title',
+    '.card-body'
+))
+_TABLE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'table.results',
+    'table.leaderboard',
+    'table[class*="result"]',
+    'table[class*="classement"]',
+    '.results-table table',
+    'table'
+))
+_LINK_SELECTORS = (sv.compile('a[class*="card-result"]'),)
+# French date patterns first (most common format), then other formats
+_DATE_PATTERNS = (*FRENCH_DATE_PATTERNS, *GENERIC_DATE_PATTERNS)
 
 
 class CyclingScraperDB:
-    def __init__(self, db_path='backend/database/cycling_data.db'):
+    def __init__(self, db_path='backend/database/cycling_data.db', http_cache=True):
         self.base_url = "https://paysdelaloirecyclisme.fr"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        # Pooled session whose adapter retries failed requests with backoff,
+        # keeping race pages in the on-disk HTTP cache unless disabled
+        self.session = create_session(USER_AGENT, HTTP_CACHE_NAME if http_cache else None)
         
         # Initialize database
         self.db = CyclingDatabase(db_path)
         print(f"Database initialized at: {db_path}")
         
+        # Race IDs already stored, loaded once so each race is checked without a query
+        self._known_race_ids = self.db.get_all_race_ids()
+        
         # Scraping statistics
         self.stats = {
             'new_races': 0,
@@ -36,96 +74,69 @@ class CyclingScraperDB:
             'new_results': 0,
             'errors': 0
         }
+        self._stats_lock = threading.Lock()
         
         # Track scraped URLs to avoid duplicates in same session
         self.scraped_urls = set()
     
     def clean_club_name(self, club_raw):
         """Remove leading numbers from club names"""
-        if not club_raw:
-            return None
-        # Remove leading numbers and spaces
-        cleaned = re.sub(r'^\d+\s*', '', club_raw.strip())
-        return cleaned if cleaned else club_raw
+        return clean_club_name(club_raw)
     
-    def generate_race_id(self, race_name, race_date, race_url):
-        """Generate a unique race ID based on name, date, and URL"""
-        # Create a more stable race ID using URL path
-        import hashlib
-        from urllib.parse import urlparse
-        
-        # Extract unique identifier from URL
+    def race_id_from_url(self, race_url):
+        """Race ID taken from the race URL alone, or None if the URL has no race identifier"""
         url_path = urlparse(race_url).path
         
-        # Use URL path as primary identifier, fallback to name+date
         if url_path and '/resultats/' in url_path:
             # Extract race ID from URL (e.g., /resultats/12345-race-name)
             path_parts = url_path.strip('/').split('/')
             if len(path_parts) >= 2:
                 url_id = path_parts[-1]  # Last part of URL
                 return f"race_{url_id}"
+        return None
+    
+    def generate_race_id(self, race_name, race_date, race_url):
+        """Generate a unique race ID based on name, date, and URL"""
+        # Use URL path as primary identifier, fallback to name+date
+        race_id = self.race_id_from_url(race_url)
+        if race_id:
+            return race_id
         
         # Fallback: hash name and date
         content = f"{race_name}_{race_date}".encode('utf-8')
         hash_short = hashlib.md5(content).hexdigest()[:8]
         return f"race_{hash_short}"
     
-    def get_page(self, url, retries=3):
-        """Get page content with retry logic"""
-        for attempt in range(retries):
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as e:
-                print(f"Attempt {attempt + 1} failed for {url}: {e}")
-                if attempt < retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    self.stats['errors'] += 1
-                    return None
+    def get_page(self, url):
+        """Get page content
+        
+        Connection errors and 5xx responses are retried with backoff by the
+        session's adapter, on the same connection pool. Race pages seen before
+        are served from the HTTP cache and revalidated once expired.
+        """
+        try:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            print(f"Request failed for {url}: {e}")
+            self._count_error()
+            return None
+    
+    def _count_error(self):
+        """Count an error; race pages are fetched from several threads"""
+        with self._stats_lock:
+            self.stats['errors'] += 1
     
     def extract_race_date(self, soup):
-        """Extract race date from various possible locations"""
-        # Try different selectors for date
-        date_selectors = [
-            '.race-date',
-            '.date',
-            '[class*="date"]',
-            'time',
-            '.event-date',
-            'h1', 'h2', 'h3',  # Sometimes date is in title
-            '.card-title',
-            '.card-body'
-        ]
-        
-        # Also check the entire page text for date patterns
-        full_text = soup.get_text()
-        
-        # Try to find French date patterns first (most common format)
-        french_date_patterns = [
-            r'(\d{1,2}\s+(?:janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4})',
-            r'(\d{1,2}\s+(?:jan|fév|mar|avr|mai|juin|juil|août|sept|oct|nov|déc)\s+\d{4})',
-        ]
-        
-        for pattern in french_date_patterns:
-            match = re.search(pattern, full_text, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        # Try selectors
-        for selector in date_selectors:
-            date_elem = soup.select_one(selector)
+        """Extract race date from the race header or other date elements"""
+        # Try different selectors for date, race header first
+        for selector in _DATE_SELECTORS:
+            date_elem = selector.select_one(soup)
             if date_elem:
                 date_text = date_elem.get_text().strip()
-                # Try to parse various date formats
-                date_patterns = [
-                    r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
-                    r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})',
-                    r'(\d{1,2}\s+\w+\s+\d{4})'
-                ]
-                for pattern in date_patterns:
-                    match = re.search(pattern, date_text)
+                for pattern in _DATE_PATTERNS:
+                    match = pattern.search(date_text)
                     if match:
                         return match.group(1)
         
@@ -142,11 +153,14 @@ class CyclingScraperDB:
             return False
         
         print(f"Checking race: {race_url}")
-        response = self.get_page(race_url)
+        return self.save_race_page(race_url, self.get_page(race_url))
+    
+    def save_race_page(self, race_url, response):
+        """Parse a fetched race page and save the race to database"""
         if not response:
             return False
             
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, BS4_PARSER)
         
         # Extract race information
         race_title = soup.find('h1')
@@ -159,7 +173,7 @@ class CyclingScraperDB:
         race_id = self.generate_race_id(race_name, race_date, race_url)
         
         # Check if this race already exists in database
-        if self.db.race_exists(race_id):
+        if race_id in self._known_race_ids:
             print(f"⏭️  Skipping already scraped race: {race_name} ({race_date})")
             self.stats['skipped_races'] += 1
             self.scraped_urls.add(race_url)
@@ -169,107 +183,85 @@ class CyclingScraperDB:
         
         # Find leaderboard/results table
         results_table = None
-        table_selectors = [
-            'table.results',
-            'table.leaderboard',
-            'table[class*="result"]',
-            'table[class*="classement"]',
-            '.results-table table',
-            'table'
-        ]
-        
-        for selector in table_selectors:
-            results_table = soup.select_one(selector)
+        for selector in _TABLE_SELECTORS:
+            results_table = selector.select_one(soup)
             if results_table:
                 break
         
         if not results_table:
             print(f"No results table found for {race_url}")
-            self.stats['errors'] += 1
+            self._count_error()
             return False
         
         try:
-            # Add race to database
-            self.db.add_or_update_race(race_id, race_date, race_name)
-            self.stats['new_races'] += 1
-            
             # Extract participants and rankings
             rows = results_table.find_all('tr')
             participants_added = 0
+            cyclist_rows = []
+            result_rows = []
             
             for row in rows[1:]:  # Skip header row
                 cells = row.find_all(['td', 'th'])
                 if len(cells) >= 2:
                     try:
-                        # Extract basic info
-                        rank_text = cells[0].get_text().strip()
-                        
-                        # Clean up rank (remove non-numeric characters except for numbers)
-                        rank_match = re.search(r'\d+', rank_text)
-                        rank = int(rank_match.group()) if rank_match else participants_added + 1
+                        # Skip if not enough data
+                        if len(cells) < 4:
+                            continue
                         
                         # Extract raw data
                         raw_data = [cell.get_text().strip() for cell in cells]
                         
-                        # Skip if not enough data
-                        if len(raw_data) < 4:
-                            continue
-                        
                         # Extract cyclist information from raw_data
                         # Typical format: [rank, uci_id, last_name, first_name, region, club, ...]
-                        uci_id = raw_data[1] if len(raw_data) > 1 else f"unknown_{participants_added}"
-                        last_name = raw_data[2] if len(raw_data) > 2 else ''
-                        first_name = raw_data[3] if len(raw_data) > 3 else ''
-                        region = raw_data[4] if len(raw_data) > 4 else ''
-                        club_raw = raw_data[5] if len(raw_data) > 5 else ''
-                        club_clean = self.clean_club_name(club_raw)
+                        uci_id = raw_data[1]
+                        last_name = raw_data[2]
+                        first_name = raw_data[3]
                         
-                        # Skip if essential data is missing
+                        # Skip if essential data is missing, before any cleanup work
                         if not uci_id or (not last_name and not first_name):
                             continue
                         
                         # Clean up names
-                        first_name = re.sub(r'\s+', ' ', first_name).strip()
-                        last_name = re.sub(r'\s+', ' ', last_name).strip()
+                        first_name = normalize_text(first_name)
+                        last_name = normalize_text(last_name)
                         
                         # Skip header-like entries
-                        if (first_name.lower() in ['nom', 'name', 'coureur', 'rider', 'prenom'] or
-                            last_name.lower() in ['nom', 'name', 'coureur', 'rider', 'prenom']):
+                        if is_header_entry(first_name, last_name):
                             continue
                         
-                        # Add or update cyclist in database
-                        self.db.add_or_update_cyclist(
-                            uci_id=uci_id,
-                            first_name=first_name,
-                            last_name=last_name,
-                            region=region,
-                            club=club_clean,
-                            club_raw=club_raw
-                        )
+                        # Clean up rank (remove non-numeric characters except for numbers)
+                        rank = extract_rank(raw_data[0], participants_added + 1)
                         
-                        # Add race result
-                        self.db.add_race_result(
-                            race_id=race_id,
-                            uci_id=uci_id,
-                            rank=rank,
-                            raw_data=raw_data
-                        )
+                        region = raw_data[4] if len(raw_data) > 4 else ''
+                        club_raw = raw_data[5] if len(raw_data) > 5 else ''
+                        club_clean = self.clean_club_name(club_raw)
                         
+                        # Queue cyclist and race result, written in bulk after the loop
+                        cyclist_rows.append((uci_id, first_name, last_name, region, club_clean, club_raw))
+                        result_rows.append((race_id, uci_id, rank, None, self.db.dump_raw_data(raw_data)))
                         participants_added += 1
-                        self.stats['new_results'] += 1
                         
                     except Exception as e:
                         print(f"Error processing participant row: {e}")
-                        self.stats['errors'] += 1
+                        self._count_error()
                         continue
             
+            # Save the race and all its participants in one transaction
+            with self.db.write_transaction() as conn:
+                self.db.add_or_update_race(race_id, race_date, race_name, conn=conn)
+                self.db.add_cyclists_bulk(cyclist_rows, conn=conn)
+                participants_added = self.db.add_results_bulk(result_rows, conn=conn)
+            self._known_race_ids.add(race_id)
+            self.stats['new_races'] += 1
+            self.stats['new_results'] += participants_added
+            
             print(f"✅ Added {participants_added} participants to race {race_id}")
             self.scraped_urls.add(race_url)
             return True
             
         except Exception as e:
             print(f"Error saving race {race_id}: {e}")
-            self.stats['errors'] += 1
+            self._count_error()
             return False
     
     def scrape_race_list_page(self, page_num):
@@ -281,29 +273,24 @@ class CyclingScraperDB:
         if not response:
             return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, BS4_PARSER)
         
         # Find race links
-        race_links = []
-        link_selectors = [
-            'a[class*="card-result"]'
-        ]
-        
-        for selector in link_selectors:
-            links = soup.select(selector)
+        race_links = {}  # dict keeps the page order while deduplicating
+        for selector in _LINK_SELECTORS:
+            links = selector.select(soup)
             for link in links:
                 href = link.get('href')
                 if href and '/resultats/' in href:
-                    full_url = urljoin(self.base_url, href)
-                    if full_url not in race_links:
-                        race_links.append(full_url)
+                    race_links[urljoin(self.base_url, href)] = None
         
-        return race_links
+        return list(race_links)
     
     def scrape_all_races(self):
         """Scrape all race pages with pagination"""
         page_num = 1
-        all_race_links = []
+        all_race_links = {}  # race URL -> None, in discovery order
+        pages_without_new_races = 0
         
         while True:
             print(f"\n--- Scraping page {page_num} ---")
@@ -313,9 +300,19 @@ class CyclingScraperDB:
                 print(f"No more races found on page {page_num}. Stopping.")
                 break
             
-            all_race_links.extend(race_links)
+            all_race_links.update(dict.fromkeys(race_links))
             print(f"Found {len(race_links)} races on page {page_num}")
             
+            # Incremental runs: newest races are listed first, so stop once
+            # the listing only shows races already in the database
+            if any(self.race_id_from_url(url) not in self._known_race_ids for url in race_links):
+                pages_without_new_races = 0
+            else:
+                pages_without_new_races += 1
+                if pages_without_new_races >= MAX_PAGES_WITHOUT_NEW_RACES:
+                    print(f"No new races on the last {pages_without_new_races} pages. Stopping.")
+                    break
+            
             page_num += 1
             time.sleep(1)  # Be respectful to the server
             
@@ -324,17 +321,26 @@ class CyclingScraperDB:
                 print("Reached page limit (100). Stopping.")
                 break
         
-        print(f"\nTotal races found: {len(all_race_links)}")
-        
-        # Remove duplicates
-        unique_race_links = list(set(all_race_links))
-        print(f"Unique races: {len(unique_race_links)}")
-        
-        # Scrape each race
-        for i, race_url in enumerate(unique_race_links, 1):
-            print(f"\n--- Race {i}/{len(unique_race_links)} ---")
-            self.scrape_race_details(race_url)
-            time.sleep(1)  # Be respectful to the server
+        # Links seen on several pages are only kept once, and races whose URL
+        # already identifies a stored race are not fetched again
+        unique_race_links = [url for url in all_race_links
+                             if self.race_id_from_url(url) not in self._known_race_ids]
+        self.stats['skipped_races'] += len(all_race_links) - len(unique_race_links)
+        print(f"\nUnique races found: {len(all_race_links)}, new: {len(unique_race_links)}")
+        
+        # Fetch races a few at a time over the shared session, then parse and
+        # save each one in order on this thread
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            for start in range(0, len(unique_race_links), MAX_CONCURRENT_REQUESTS):
+                batch = unique_race_links[start:start + MAX_CONCURRENT_REQUESTS]
+                responses = list(executor.map(self.get_page, batch))
+                
+                for i, (race_url, response) in enumerate(zip(batch, responses), start + 1):
+                    print(f"\n--- Race {i}/{len(unique_race_links)} ---")
+                    print(f"Checking race: {race_url}")
+                    self.save_race_page(race_url, response)
+                
+                time.sleep(RATE_LIMIT_DELAY)  # Be respectful to the server
         
         # Update scraping info
         db_stats = self.db.get_database_stats()
@@ -363,8 +369,16 @@ class CyclingScraperDB:
 
 def main():
     """Main function to run the database scraper"""
-    db_path = sys.argv[1] if len(sys.argv) > 1 else 'database/cycling_data.db'
-    scraper = CyclingScraperDB(db_path)
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Cycling results scraper (Database version)')
+    parser.add_argument('db_path', nargs='?', default='database/cycling_data.db',
+                        help='Database path (default: database/cycling_data.db)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not use the on-disk HTTP cache for race pages')
+    args = parser.parse_args()
+    
+    scraper = CyclingScraperDB(args.db_path, http_cache=not args.no_cache)
     
     try:
         print("Starting cycling results scraper (Database version)...")
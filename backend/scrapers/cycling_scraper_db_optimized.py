@@ -4,12 +4,25 @@ Optimized Cycling Results Scraper for Pays de la Loire - Database Version
 Enhanced version with proper logging, error handling, and code organization
 """
 
+import logging
+import multiprocessing
+import re
+import sqlite3
 import sys
 import time
-from typing import List, Dict, Optional, Set
-from urllib.parse import urljoin
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Set
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:  # Modest backend, removed in selectolax 1.0
+        from selectolax.parser import HTMLParser
+    except ImportError:  # selectolax is optional, listing and race pages fall back to BeautifulSoup
+        HTMLParser = None
+
 # Add project root to path for backend imports
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -18,29 +31,382 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from backend.config.constants import (
     BASE_URL, RESULTS_BASE_URL, DEFAULT_DATE, get_race_search_params, DEFAULT_REGION, AVAILABLE_REGIONS,
     RATE_LIMIT_DELAY, MAX_PAGES, RACE_LINK_SELECTORS, RESULTS_TABLE_SELECTORS, USER_AGENT,
-    DEFAULT_DB_PATH, SUCCESS_MESSAGES, ERROR_MESSAGES
+    DEFAULT_DB_PATH, SUCCESS_MESSAGES, ERROR_MESSAGES, PARSE_WORKERS, MAX_CONCURRENT_REQUESTS,
+    HTTP_CACHE_NAME
 )
 from backend.utils.scraper_utils import (
-    create_session, get_page_with_retry, extract_race_date,
-    generate_race_id, find_results_table, extract_participant_data,
-    build_search_url, validate_race_data, ScrapingError
+    create_session, get_page_with_retry, fetch_many, extract_race_date, convert_abbreviated_months_to_french,
+    generate_race_id, find_results_table, extract_participant_from_cells,
+    build_search_url, validate_race_data, ScrapingError, BS4_PARSER
 )
 from backend.utils.logging_utils import (
-    get_scraper_logger, ScrapingProgressLogger, log_summary, log_database_stats
+    get_scraper_logger, ScrapingProgressLogger, log_summary, log_database_stats,
+    start_worker_log_listener, init_worker_logging
 )
 from backend.database.models import CyclingDatabase
 
+# Category leaderboards anywhere in text:
+# - Access categories: A1, A2, A3, A4, A1-A2, A1A2, A3-A4, A3A4, ACCESS 1 2, ACCESS 3 4, ACCESS 1-2, ACCESS 3-4, Access 1.2, Access 3.4, ACCESS 1 & 2, ACCESS 3 & 4
+# - Youth categories: U7, U9, U11, U13, U15, U17, U-7, U-9, U-11, U-13, U-15, U-17, U 7, U 9, U 11, U 13, U 15, U 17
+_CATEGORY_RE = re.compile(
+    r'\b(A[1-4](-?A[1-4])?|A[1-4]-[1-4]|A(cces|cces)s?\s*[1-4](\s*[2-4]|-[2-4]|\.?[2-4]|\s*&\s*[2-4])?|U-?\s*[7-9]|U-?\s*1[1357])\b',
+    re.IGNORECASE
+)
+_ETAPE_WORD_RE = re.compile(r'[EeÉ]tape')
+_ETAPE_RE = re.compile(r'(Étape|Etape|etape)\s*\d+', re.IGNORECASE)
+
+# Multi-day card dates, with and without proper spacing
+_MULTI_DAY_NOSPACE_RE = re.compile(r'u?\s*(\d{1,2}\s+\w+?)au\s*\d{1,2}\s+\w+?(\d{4})', re.IGNORECASE)
+_MULTI_DAY_RE = re.compile(r'Du\s+(\d{1,2}\s+\w+).*?(\d{4})', re.IGNORECASE)
+# Last day of a multi-day card date, right after a first day written without its year
+_MULTI_DAY_END_RE = re.compile(r'\W*au\s*\d{1,2}\s+([^\W\d]+)', re.IGNORECASE)
+_MONTH_PREFIXES = (
+    ('jan', 1), ('fév', 2), ('fev', 2), ('mar', 3), ('avr', 4), ('mai', 5), ('juin', 6), ('jun', 6),
+    ('juil', 7), ('jul', 7), ('aoû', 8), ('aou', 8), ('sep', 9), ('oct', 10), ('nov', 11),
+    ('déc', 12), ('dec', 12)
+)
+_WS_RE = re.compile(r'\s+')
+
+# Race cards on listing pages
+_CARD_SELECTOR = 'a.card-result[href*="/resultats/"]'
+_CARD_FIELD_SELECTORS = {
+    'name': 'h3',
+    'raw_date': 'time.card-result__date',
+    'location': '.card-result__place',
+    'categories': '.card-result__licences'
+}
+
+# Listing hrefs are either absolute paths ("/resultats/...") or full URLs
+_BASE_URL_STRIPPED = BASE_URL.rstrip('/')
+
+# Race page parsing runs in worker processes, log through the scraper logger
+logger = logging.getLogger('scraper')
+
+
+def _month_number(month: str) -> Optional[int]:
+    """Get the number of a full or abbreviated French month name, None if unknown"""
+    month = month.lower()
+    for prefix, number in _MONTH_PREFIXES:
+        if month.startswith(prefix):
+            return number
+    return None
+
+
+def _multi_day_start_year(raw_date: str, match) -> str:
+    """
+    Get the year of the first day of a multi-day card date
+
+    When only the last day carries the year, a range crossing New Year
+    ("Du 30 déc. au 2 janv. 2025") started the year before.
+
+    Args:
+        raw_date: Raw date text from card
+        match: Multi-day match, first day and month in group 1, year in group 2
+
+    Returns:
+        Year of the first day
+    """
+    year = match.group(2).strip()
+    end = _MULTI_DAY_END_RE.match(raw_date, match.end(1))
+    if end:
+        start_month = _month_number(match.group(1).split()[-1])
+        end_month = _month_number(end.group(1))
+        if start_month and end_month and start_month > end_month:
+            return str(int(year) - 1)
+    return year
+
+
+def _is_category_or_etape(text: str) -> bool:
+    """Check if text contains etape or matches category pattern"""
+    return bool(_ETAPE_WORD_RE.search(text) or _CATEGORY_RE.search(text))
+
+
+def _extract_category_name(text: str) -> str:
+    """Extract the category name from text (e.g., 'A1-A2' from 'Classement: A1-A2')"""
+    # First check for etape
+    if _ETAPE_WORD_RE.search(text):
+        match = _ETAPE_RE.search(text)
+        return match.group(0) if match else text
+
+    # Extract category pattern
+    match = _CATEGORY_RE.search(text)
+    if match:
+        return match.group(0)
+
+    return text  # Fallback to full text
+
+
+def _find_etape_stages(li_options: List, select_options: List) -> List[Dict[str, str]]:
+    """
+    Find etape stages and category-based leaderboards in multi-stage races
+
+    Args:
+        li_options: <li class="select2-results__option"> elements of the race page
+        select_options: <option> elements found inside <select> elements of the race page
+
+    Returns:
+        List of dictionaries with etape/category information
+    """
+    etape_stages = []
+
+    # First try: Look for <li> elements with select2-results__option class (original approach)
+    for li in li_options:
+        # Get the text content to check for etape or category
+        li_text = li.get_text().strip()
+
+        # Check if this li contains "Etape" or matches category pattern
+        if _is_category_or_etape(li_text):
+            # Extract payload from id attribute
+            li_id = li.get('id', '')
+
+            # Parse id like "select2-resultCategory-result-29be-ranking1" to extract "ranking1"
+            if li_id and '-' in li_id:
+                payload = li_id.split('-')[-1]  # Get last part after final dash
+
+                if payload:
+                    category_name = _extract_category_name(li_text)
+                    etape_stages.append({
+                        'etape_name': category_name,
+                        'payload': payload
+                    })
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Found etape/category (li method): %s with payload: %s", category_name, payload)
+
+    # Second try: Look for <select> elements with <option> children (new approach)
+    if not etape_stages:
+        for option in select_options:
+            option_text = option.get_text().strip()
+            option_value = option.get('value', '')
+
+            # Check if this option contains "Etape" or matches category pattern
+            if _is_category_or_etape(option_text):
+                if option_value:
+                    category_name = _extract_category_name(option_text)
+                    etape_stages.append({
+                        'etape_name': category_name,
+                        'payload': option_value
+                    })
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Found etape/category (select method): %s with payload: %s",
+                                     category_name, option_value)
+
+    return etape_stages
+
+
+def _find_etape_results_table(soup, payload: str, divs_by_id: Dict[str, object]):
+    """
+    Find the results table for a specific etape payload
+
+    Args:
+        soup: BeautifulSoup object of the race page
+        payload: The payload identifier (e.g., "ranking1")
+        divs_by_id: Divs of the race page indexed by their id attribute
+
+    Returns:
+        BeautifulSoup table element or None
+    """
+    # Try to find div with id matching payload
+    target_div = divs_by_id.get(payload)
+
+    # If not found by id, try to find by class or data attributes
+    if not target_div:
+        target_div = soup.find('div', class_=payload)
+
+    # If still not found, try data attributes or other selectors
+    if not target_div:
+        target_div = soup.find('div', attrs={'data-category': payload})
+
+    # If still not found, let the CSS engine match the payload inside common attributes
+    if not target_div:
+        escaped = payload.replace('\\', '\\\\').replace('"', '\\"')
+        target_div = soup.select_one(
+            f'div[id*="{escaped}"], div[class*="{escaped}"], div[data-category*="{escaped}"]'
+        )
+
+    if target_div:
+        logger.debug(f"Found target div for payload: {payload}")
+
+        # Look for results table within this div using existing selectors
+        for selector in RESULTS_TABLE_SELECTORS:
+            table = target_div.select_one(selector)
+            if table:
+                logger.debug(f"Found results table with selector: {selector}")
+                return table
+
+        # If no table found with standard selectors, try generic table search
+        table = target_div.find('table')
+        if table:
+            logger.debug("Found results table with generic table selector")
+            return table
+
+    logger.warning(f"No results table found for payload: {payload}")
+    return None
+
+
+def _table_rows_cells(results_table) -> List[List[str]]:
+    """
+    Get the stripped cell texts of every row of a results table
+
+    Args:
+        results_table: BeautifulSoup table element
+
+    Returns:
+        List of rows, each a list of cell texts
+    """
+    return [
+        [cell.get_text().strip() for cell in row.find_all(['td', 'th'])]
+        for row in results_table.find_all('tr')
+    ]
+
+
+def _extract_results(results_table) -> Dict[str, Any]:
+    """
+    Extract participant data from a results table
+
+    Args:
+        results_table: BeautifulSoup table element
+
+    Returns:
+        Dictionary with the participant count, valid participants and row errors
+    """
+    return _extract_results_from_rows(_table_rows_cells(results_table))
+
+
+def _extract_results_from_rows(rows: List[List[str]]) -> Dict[str, Any]:
+    """
+    Extract participant data from the cell texts of a results table
+
+    Args:
+        rows: Rows of the results table, header row first, each a list of cell texts
+
+    Returns:
+        Dictionary with the participant count, valid participants and row errors
+    """
+    # Count total participants (excluding header row)
+    total_participants = len(rows) - 1 if len(rows) > 1 else 0
+    participants = []
+    errors = 0
+
+    for row in rows[1:]:  # Skip header row
+        try:
+            participant_data = extract_participant_from_cells(row)
+        except Exception as e:
+            logger.warning(f"Error processing participant: {e}")
+            errors += 1
+            continue
+
+        if participant_data:
+            participants.append(participant_data)
+
+    return {
+        'total_participants': total_participants,
+        'participants': participants,
+        'errors': errors
+    }
+
+
+def _parse_single_race_page_fast(html: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse a single race page with selectolax
+
+    Multi-stage pages keep going through BeautifulSoup, so this gives up as soon
+    as the page has an etape or category selector.
+
+    Args:
+        html: Raw HTML content of the race page
+
+    Returns:
+        Parsed race page like _parse_race_page, or None if the page may have etapes
+    """
+    tree = HTMLParser(html)
+
+    for option in tree.css('li.select2-results__option, select option'):
+        if _is_category_or_etape(option.text().strip()):
+            return None
+
+    for selector in RESULTS_TABLE_SELECTORS:
+        results_table = tree.css_first(selector)
+        if results_table is not None:
+            rows = [
+                [cell.text().strip() for cell in row.css('td, th')]
+                for row in results_table.css('tr')
+            ]
+            return {'etapes': [], 'results': _extract_results_from_rows(rows)}
+
+    logger.warning("No results table found with any selector")
+    return {'etapes': [], 'results': None}
+
+
+def _parse_race_page(html: bytes) -> Dict[str, Any]:
+    """
+    Parse a race page into plain data
+
+    Kept at module level and free of scraper state so it can run in a worker process.
+    Single race pages are parsed with selectolax when available.
+
+    Args:
+        html: Raw HTML content of the race page
+
+    Returns:
+        Dictionary with 'etapes' (each etape carries its 'results') for multi-stage
+        races, or 'results' for single races. Results are None when no table is found.
+    """
+    if HTMLParser is not None:
+        try:
+            parsed = _parse_single_race_page_fast(html)
+            if parsed is not None:
+                return parsed
+        except Exception as e:
+            logger.warning(f"Fast race page parsing failed, falling back to BeautifulSoup: {e}")
+
+    soup = BeautifulSoup(html, BS4_PARSER)
+
+    # Check for multi-stage races with etapes
+    li_options = soup.select('li.select2-results__option')
+    select_options = soup.select('select option')
+    etape_stages = _find_etape_stages(li_options, select_options)
+
+    if etape_stages:
+        # Index divs by id once so each etape lookup avoids a tree walk.
+        # The first div wins on repeated ids, as with soup.find
+        divs_by_id = {}
+        for div in soup.find_all('div', id=True):
+            divs_by_id.setdefault(div['id'], div)
+
+        for etape_info in etape_stages:
+            results_table = _find_etape_results_table(soup, etape_info['payload'], divs_by_id)
+            etape_info['results'] = _extract_results(results_table) if results_table else None
+
+        return {'etapes': etape_stages, 'results': None}
+
+    results_table = find_results_table(soup, RESULTS_TABLE_SELECTORS)
+    return {
+        'etapes': [],
+        'results': _extract_results(results_table) if results_table else None
+    }
+
 
 class OptimizedCyclingScraperDB:
     """
     Optimized database scraper with improved error handling and logging
     """
     
-    def __init__(self, db_path: str = DEFAULT_DB_PATH, region: str = DEFAULT_REGION):
-        """Initialize the scraper with database connection and logging"""
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, region: str = DEFAULT_REGION,
+                 store_raw_data: bool = True, http_cache: bool = True):
+        """
+        Initialize the scraper with database connection and logging
+        
+        Args:
+            db_path: Path to the SQLite database
+            region: Region to scrape
+            store_raw_data: Whether to store each participant's raw table cells.
+                When False, readers rebuild raw_data from the normalized columns.
+            http_cache: Whether to keep race pages in the on-disk HTTP cache
+        """
         self.logger = get_scraper_logger()
         self.db_path = db_path
         self.region = region
+        self.store_raw_data = store_raw_data
         
         # Validate region
         if region not in AVAILABLE_REGIONS:
@@ -52,12 +418,41 @@ class OptimizedCyclingScraperDB:
         try:
             self.db = CyclingDatabase(db_path)
             self.logger.info(f"Database initialized at: {db_path}")
+            
+            # Preload known race IDs so existence checks stay in memory
+            self._known_race_ids: Set[str] = self.db.get_all_race_ids()
+            self.logger.debug(f"Loaded {len(self._known_race_ids)} known race IDs")
         except Exception as e:
             self.logger.error(f"Failed to initialize database: {e}")
             raise ScrapingError(f"Database initialization failed: {e}")
         
         # Initialize HTTP session
-        self.session = create_session(USER_AGENT)
+        self.session = create_session(USER_AGENT, HTTP_CACHE_NAME if http_cache else None)
+        
+        # Search parameters are region-constant; only the page number varies
+        self._search_params = get_race_search_params(region)
+        
+        # Race pages are parsed in worker processes while the next page is fetched.
+        # Workers send their log records back here instead of writing the log files.
+        # They are not forked from this process, which already runs logging and
+        # fetch threads whose held locks a forked child could inherit.
+        self._parse_pool = None
+        self._worker_log_listener = None
+        if PARSE_WORKERS > 1:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            mp_context = multiprocessing.get_context(start_method)
+            worker_log_queue, self._worker_log_listener = start_worker_log_listener(mp_context)
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=mp_context,
+                initializer=init_worker_logging,
+                initargs=(worker_log_queue, self.logger.getEffectiveLevel())
+            )
+        
+        # Race pages are fetched by long-lived threads sharing the session's connection pool
+        self._fetch_pool = (
+            ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) if MAX_CONCURRENT_REQUESTS > 1 else None
+        )
         
         # Statistics tracking
         self.stats = {
@@ -85,8 +480,7 @@ class OptimizedCyclingScraperDB:
         Returns:
             List of race URLs found on the page
         """
-        race_search_params = get_race_search_params(self.region)
-        url = build_search_url(RESULTS_BASE_URL, race_search_params, page_num)
+        url = build_search_url(RESULTS_BASE_URL, self._search_params, page_num)
         
         self.logger.debug(f"Scraping page {page_num}: {url}")
         
@@ -96,61 +490,52 @@ class OptimizedCyclingScraperDB:
             self.stats['errors'] += 1
             return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
         race_links = []
+        seen_links: Set[str] = set()
         
         # Find race cards and extract metadata - now primary data source
-        race_cards = soup.select('a.card-result[href*="/resultats/"]')
+        race_cards = self._parse_cards(response.content)
 
         for card in race_cards:
-            href = card.get('href')
+            href = card['href']
             if href and '/resultats/' in href:
-                full_url = urljoin(BASE_URL, href)
-                if full_url not in race_links:
+                full_url = href if href.startswith('http') else _BASE_URL_STRIPPED + href
+                if full_url not in seen_links:
+                    seen_links.add(full_url)
                     race_links.append(full_url)
 
                     # Extract comprehensive metadata from card
                     try:
-                        # Extract race name from h3 element
-                        name_elem = card.select_one('h3')
-                        card_name = name_elem.get_text().strip() if name_elem else ""
-
-                        # Extract date from time element with class card-result__date
-                        date_elem = card.select_one('time.card-result__date')
-                        raw_date = date_elem.get_text().strip() if date_elem else ""
-
                         # Process multi-day dates and convert months
-                        card_date = self._process_card_date(raw_date)
-
-                        # Extract location from card-result__place
-                        place_elem = card.select_one('.card-result__place')
-                        card_location = place_elem.get_text().strip() if place_elem else ""
-
-                        # Extract categories from card-result__licences
-                        licences_elem = card.select_one('.card-result__licences')
-                        card_categories = licences_elem.get_text().strip() if licences_elem else ""
+                        card_date = self._process_card_date(card['raw_date'])
 
                         # Store comprehensive metadata for this URL
                         self.card_metadata[full_url] = {
-                            'name': card_name,
+                            'name': card['name'],
                             'date': card_date,
-                            'location': card_location,
-                            'categories': card_categories
+                            'location': card['location'],
+                            'categories': card['categories']
                         }
-                        self.logger.debug(f"Stored card metadata for {full_url}: name='{card_name}', date='{card_date}', location='{card_location}', categories='{card_categories}'")
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(
+                                "Stored card metadata for %s: name='%s', date='%s', location='%s', categories='%s'",
+                                full_url, card['name'], card_date, card['location'], card['categories']
+                            )
 
                     except Exception as e:
                         self.logger.warning(f"Failed to extract card metadata for {full_url}: {e}")
         
         # Fallback: use original selectors if no cards found
         if not race_links:
+            soup = BeautifulSoup(response.content, BS4_PARSER)
             for selector in RACE_LINK_SELECTORS:
                 links = soup.select(selector)
                 for link in links:
                     href = link.get('href')
                     if href and '/resultats/' in href:
-                        full_url = urljoin(BASE_URL, href)
-                        if full_url not in race_links:
+                        full_url = href if href.startswith('http') else _BASE_URL_STRIPPED + href
+                        if full_url not in seen_links:
+                            seen_links.add(full_url)
                             race_links.append(full_url)
         
         self.stats['pages_scraped'] += 1
@@ -158,6 +543,56 @@ class OptimizedCyclingScraperDB:
         
         return race_links
     
+    def _parse_cards(self, html: bytes) -> List[Dict[str, str]]:
+        """
+        Extract race cards from a listing page
+
+        Uses selectolax when available and falls back to BeautifulSoup otherwise
+        or if the fast parser fails.
+
+        Args:
+            html: Raw HTML content of the listing page
+
+        Returns:
+            List of card dictionaries with href, name, raw_date, location and categories
+        """
+        if HTMLParser is not None:
+            try:
+                return self._parse_cards_fast(html)
+            except Exception as e:
+                self.logger.warning(f"Fast card parsing failed, falling back to BeautifulSoup: {e}")
+
+        soup = BeautifulSoup(html, BS4_PARSER)
+        cards = []
+        for card in soup.select(_CARD_SELECTOR):
+            parsed = {'href': card.get('href')}
+            for field, selector in _CARD_FIELD_SELECTORS.items():
+                elem = card.select_one(selector)
+                parsed[field] = elem.get_text().strip() if elem else ""
+            cards.append(parsed)
+        return cards
+
+    @staticmethod
+    def _parse_cards_fast(html: bytes) -> List[Dict[str, str]]:
+        """
+        Extract race cards from a listing page with selectolax
+
+        Args:
+            html: Raw HTML content of the listing page
+
+        Returns:
+            List of card dictionaries with href, name, raw_date, location and categories
+        """
+        tree = HTMLParser(html)
+        cards = []
+        for card in tree.css(_CARD_SELECTOR):
+            parsed = {'href': card.attributes.get('href')}
+            for field, selector in _CARD_FIELD_SELECTORS.items():
+                elem = card.css_first(selector)
+                parsed[field] = elem.text().strip() if elem else ""
+            cards.append(parsed)
+        return cards
+
     def scrape_race_details(self, race_url: str) -> bool:
         """
         Scrape individual race details and save to database
@@ -168,336 +603,228 @@ class OptimizedCyclingScraperDB:
         Returns:
             True if race was successfully scraped, False otherwise
         """
+        html = self._fetch_race_page(race_url)
+        if html is None:
+            return False
+
+        return self._store_race_page(race_url, self._submit_parse(html))
+
+    def _needs_fetch(self, race_url: str) -> bool:
+        """
+        Check whether a race page still needs to be fetched
+
+        Args:
+            race_url: URL of the race page
+
+        Returns:
+            True if the page should be fetched, False if the race is skipped
+        """
         # Skip if already processed in this session
         if race_url in self.processed_urls:
             self.logger.debug(f"Already processed in session: {race_url}")
             self.stats['skipped_races'] += 1
             return False
 
-        self.logger.debug(f"Scraping race: {race_url}")
-
-        # Fetch page content
-        response = get_page_with_retry(self.session, race_url)
-        if not response:
-            self.logger.error(f"Failed to fetch race page: {race_url}")
+        # Use ONLY card metadata - no page data extraction
+        if race_url not in self.card_metadata:
+            # No card metadata available - skip this race
+            self.logger.warning(f"No card metadata available for {race_url}, skipping race")
             self.stats['errors'] += 1
             return False
 
-        try:
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Use ONLY card metadata - no page data extraction
-            if race_url in self.card_metadata:
-                card_data = self.card_metadata[race_url]
-                base_race_name = card_data.get('name', 'Unknown Race')
-                race_date = card_data.get('date', DEFAULT_DATE)
+        return self.card_metadata[race_url].get('date', DEFAULT_DATE) != DEFAULT_DATE
 
-                self.logger.debug(f"Using card data only: name='{base_race_name}', date='{race_date}'")
-            else:
-                # No card metadata available - skip this race
-                self.logger.warning(f"No card metadata available for {race_url}, skipping race")
-                self.stats['errors'] += 1
-                return False
-
-            if race_date != DEFAULT_DATE:
-                # Check for multi-stage races with etapes
-                etape_stages = self._find_etape_stages(soup)
-
-                if etape_stages:
-                    # Process each etape as a separate race
-                    self.logger.info(f"Found {len(etape_stages)} etapes for race: {base_race_name}")
-                    races_processed = 0
-
-                    for i, etape_info in enumerate(etape_stages):
-                        try:
-                            self.logger.info(f"Starting etape {i+1}/{len(etape_stages)}: {etape_info['etape_name']}")
-                            etape_name = f"{base_race_name} - {etape_info['etape_name']}"
-                            race_id = generate_race_id(etape_name, race_date, race_url + f"#{etape_info['payload']}")
-
-                            self.logger.debug(f"Processing etape: {etape_name} with race_id: {race_id}")
-
-                            # Check if this etape already exists
-                            if self.db.race_exists(race_id):
-                                self.logger.info(f"Etape already exists, skipping: {etape_name}")
-                                continue
-
-                            # Find results table for this etape
-                            self.logger.debug(f"Looking for results table with payload: {etape_info['payload']}")
-                            results_table = self._find_etape_results_table(soup, etape_info['payload'])
-                            if not results_table:
-                                self.logger.warning(f"No results table found for etape: {etape_info['etape_name']}")
-                                continue
-
-                            self.logger.debug(f"Found results table for etape: {etape_info['etape_name']}")
-
-                            # Add etape race to database
-                            self.db.add_or_update_race(race_id, race_date, etape_name)
-                            self.stats['new_races'] += 1
-                            self.logger.debug(f"Added etape race to database: {etape_name}")
-
-                            # Process participants for this etape
-                            participants_added = self._process_race_participants(results_table, race_id)
-
-                            self.logger.info(f"Etape processed successfully: {etape_name} with {participants_added} participants")
-                            races_processed += 1
-                        except Exception as e:
-                            self.logger.error(f"Error processing etape {i+1} ({etape_info['etape_name']}): {str(e)}")
-                            self.stats['errors'] += 1
-                            import traceback
-                            self.logger.debug(f"Traceback: {traceback.format_exc()}")
-                            continue  # Continue with next etape instead of failing entirely
-
-                    self.processed_urls.add(race_url)
-                    return races_processed > 0
-
-                else:
-                    # Standard single race processing
-                    race_id = generate_race_id(base_race_name, race_date, race_url)
-
-                    # Check if race already exists in database
-                    if self.db.race_exists(race_id):
-                        self.logger.debug(f"Race already exists: {base_race_name} ({race_date})")
-                        self.stats['skipped_races'] += 1
-                        self.processed_urls.add(race_url)
-                        return False
-
-                    # Find results table
-                    results_table = find_results_table(soup, RESULTS_TABLE_SELECTORS)
-                    if not results_table:
-                        self.logger.warning(f"No results table found: {race_url}")
-                        self.stats['errors'] += 1
-                        return False
+    def _fetch_race_page(self, race_url: str) -> Optional[bytes]:
+        """
+        Fetch a race page if it still needs to be scraped
 
-                    # Add race to database
-                    self.db.add_or_update_race(race_id, race_date, base_race_name)
-                    self.stats['new_races'] += 1
+        Args:
+            race_url: URL of the race page to fetch
 
-                    # Process participants
-                    participants_added = self._process_race_participants(
-                        results_table, race_id
-                    )
+        Returns:
+            Raw HTML content or None if the race is skipped or the fetch failed
+        """
+        if not self._needs_fetch(race_url):
+            return None
 
-                    self.logger.info(
-                        SUCCESS_MESSAGES['race_scraped'].format(
-                            count=participants_added, race_id=race_id
-                        )
-                    )
+        self.logger.debug(f"Scraping race: {race_url}")
 
-                    self.processed_urls.add(race_url)
-                    return True
-            else:
-                return False
+        return self._response_content(race_url, get_page_with_retry(self.session, race_url))
 
-        except Exception as e:
-            self.logger.error(f"Error processing race {race_url}: {e}")
-            self.stats['errors'] += 1
-            return False
-    
-    def _process_race_participants(self, results_table, race_id: str) -> int:
+    def _response_content(self, race_url: str, response) -> Optional[bytes]:
         """
-        Process participants from results table
+        Get the content of a fetched race page, recording failed fetches
 
         Args:
-            results_table: BeautifulSoup table element
-            race_id: Race ID for database storage
+            race_url: URL of the race page
+            response: Response returned by the fetch, None if it failed
 
         Returns:
-            Number of participants successfully added
+            Raw HTML content or None if the fetch failed
         """
-        rows = results_table.find_all('tr')
-        participants_added = 0
-
-        # Count total participants (excluding header row)
-        total_participants = len(rows) - 1 if len(rows) > 1 else 0
+        if not response:
+            self.logger.error(f"Failed to fetch race page: {race_url}")
+            self.stats['errors'] += 1
+            return None
 
-        for row in rows[1:]:  # Skip header row
-            try:
-                participant_data = extract_participant_data(row)
-                if not participant_data:
-                    continue
-
-                # Add cyclist to database
-                self.db.add_or_update_cyclist(
-                    uci_id=participant_data['uci_id'],
-                    first_name=participant_data['first_name'],
-                    last_name=participant_data['last_name'],
-                    region=participant_data['region'],
-                    club=participant_data['club_clean'],
-                    club_raw=participant_data['club_raw']
-                )
+        return response.content
 
-                # Add race result with participant count
-                self.db.add_race_result(
-                    race_id=race_id,
-                    uci_id=participant_data['uci_id'],
-                    rank=participant_data['rank'],
-                    race_participant_count=total_participants,
-                    raw_data=participant_data['raw_data']
-                )
+    def _submit_parse(self, html: bytes) -> Future:
+        """
+        Parse a race page, in the worker pool when one is available
 
-                participants_added += 1
-                self.stats['new_results'] += 1
+        Args:
+            html: Raw HTML content of the race page
 
-            except Exception as e:
-                self.logger.warning(f"Error processing participant: {e}")
-                self.stats['errors'] += 1
-                continue
+        Returns:
+            Future resolving to the parsed race page
+        """
+        if self._parse_pool is not None:
+            return self._parse_pool.submit(_parse_race_page, html)
 
-        return participants_added
+        future = Future()
+        try:
+            future.set_result(_parse_race_page(html))
+        except Exception as e:
+            future.set_exception(e)
+        return future
 
-    def _find_etape_stages(self, soup) -> List[Dict[str, str]]:
+    def _store_race_page(self, race_url: str, parsed_future: Future) -> bool:
         """
-        Find etape stages and category-based leaderboards in multi-stage races
+        Save a parsed race page to the database
 
         Args:
-            soup: BeautifulSoup object of the race page
+            race_url: URL of the race page
+            parsed_future: Future resolving to the parsed race page
 
         Returns:
-            List of dictionaries with etape/category information
+            True if race was successfully scraped, False otherwise
         """
-        import re
+        try:
+            parsed = parsed_future.result()
 
-        etape_stages = []
+            card_data = self.card_metadata[race_url]
+            base_race_name = card_data.get('name', 'Unknown Race')
+            race_date = card_data.get('date', DEFAULT_DATE)
 
-        # Pattern to match category leaderboards anywhere in text:
-        # - Access categories: A1, A2, A3, A4, A1-A2, A1A2, A3-A4, A3A4, ACCESS 1 2, ACCESS 3 4, ACCESS 1-2, ACCESS 3-4, Access 1.2, Access 3.4, ACCESS 1 & 2, ACCESS 3 & 4
-        # - Youth categories: U7, U9, U11, U13, U15, U17, U-7, U-9, U-11, U-13, U-15, U-17, U 7, U 9, U 11, U 13, U 15, U 17
-        category_pattern = r'\b(A[1-4](-?A[1-4])?|A[1-4]-[1-4]|A(cces|cces)s?\s*[1-4](\s*[2-4]|-[2-4]|\.?[2-4]|\s*&\s*[2-4])?|U-?\s*[7-9]|U-?\s*1[1357])\b'
+            self.logger.debug(f"Using card data only: name='{base_race_name}', date='{race_date}'")
 
-        def is_category_or_etape(text: str) -> bool:
-            """Check if text contains etape or matches category pattern"""
-            # Check for etape
-            if any(etape_word in text for etape_word in ['Etape', 'etape', 'Étape']):
-                return True
-            # Check for category pattern anywhere in text (using search instead of match)
-            if re.search(category_pattern, text, re.IGNORECASE):
+            etape_stages = parsed['etapes']
+
+            if etape_stages:
+                # Process each etape as a separate race
+                self.logger.info(f"Found {len(etape_stages)} etapes for race: {base_race_name}")
+                races_processed = 0
+
+                for i, etape_info in enumerate(etape_stages):
+                    try:
+                        self.logger.info(f"Starting etape {i+1}/{len(etape_stages)}: {etape_info['etape_name']}")
+                        etape_name = f"{base_race_name} - {etape_info['etape_name']}"
+                        race_id = generate_race_id(etape_name, race_date, race_url + f"#{etape_info['payload']}")
+
+                        self.logger.debug(f"Processing etape: {etape_name} with race_id: {race_id}")
+
+                        # Check if this etape already exists
+                        if race_id in self._known_race_ids:
+                            self.logger.info(f"Etape already exists, skipping: {etape_name}")
+                            continue
+
+                        # Results table for this etape
+                        results = etape_info['results']
+                        if not results:
+                            self.logger.warning(f"No results table found for etape: {etape_info['etape_name']}")
+                            continue
+
+                        # Add etape race and its participants in one transaction
+                        with self.db.write_transaction() as conn:
+                            self.db.add_or_update_race(race_id, race_date, etape_name, conn=conn)
+                            participants_added = self._process_race_participants(results, race_id, conn)
+                        self._known_race_ids.add(race_id)
+                        self.stats['new_races'] += 1
+                        self.logger.debug(f"Added etape race to database: {etape_name}")
+
+                        self.logger.info(f"Etape processed successfully: {etape_name} with {participants_added} participants")
+                        races_processed += 1
+                    except Exception as e:
+                        self.logger.error(f"Error processing etape {i+1} ({etape_info['etape_name']}): {str(e)}")
+                        self.stats['errors'] += 1
+                        import traceback
+                        self.logger.debug(f"Traceback: {traceback.format_exc()}")
+                        continue  # Continue with next etape instead of failing entirely
+
+                self.processed_urls.add(race_url)
+                return races_processed > 0
+
+            else:
+                # Standard single race processing
+                race_id = generate_race_id(base_race_name, race_date, race_url)
+
+                # Check if race already exists in database
+                if race_id in self._known_race_ids:
+                    self.logger.debug(f"Race already exists: {base_race_name} ({race_date})")
+                    self.stats['skipped_races'] += 1
+                    self.processed_urls.add(race_url)
+                    return False
+
+                # Results table
+                results = parsed['results']
+                if not results:
+                    self.logger.warning(f"No results table found: {race_url}")
+                    self.stats['errors'] += 1
+                    return False
+
+                # Add race and its participants in one transaction
+                with self.db.write_transaction() as conn:
+                    self.db.add_or_update_race(race_id, race_date, base_race_name, conn=conn)
+                    participants_added = self._process_race_participants(results, race_id, conn)
+                self._known_race_ids.add(race_id)
+                self.stats['new_races'] += 1
+
+                self.logger.info(
+                    SUCCESS_MESSAGES['race_scraped'].format(
+                        count=participants_added, race_id=race_id
+                    )
+                )
+
+                self.processed_urls.add(race_url)
                 return True
-            return False
 
-        def extract_category_name(text: str) -> str:
-            """Extract the category name from text (e.g., 'A1-A2' from 'Classement: A1-A2')"""
-            # First check for etape
-            for etape_word in ['Etape', 'etape', 'Étape']:
-                if etape_word in text:
-                    # Extract the etape part
-                    match = re.search(r'(Étape|Etape|etape)\s*\d+', text, re.IGNORECASE)
-                    if match:
-                        return match.group(0)
-                    return text  # Return full text if no match
-
-            # Extract category pattern
-            match = re.search(category_pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-
-            return text  # Fallback to full text
-
-        # First try: Look for <li> elements with select2-results__option class (original approach)
-        li_elements = soup.find_all('li', class_='select2-results__option')
-
-        for li in li_elements:
-            # Get the text content to check for etape or category
-            li_text = li.get_text().strip()
-
-            # Check if this li contains "Etape" or matches category pattern
-            if is_category_or_etape(li_text):
-                # Extract payload from id attribute
-                li_id = li.get('id', '')
-
-                # Parse id like "select2-resultCategory-result-29be-ranking1" to extract "ranking1"
-                if li_id and '-' in li_id:
-                    payload = li_id.split('-')[-1]  # Get last part after final dash
-
-                    if payload:
-                        category_name = extract_category_name(li_text)
-                        etape_stages.append({
-                            'etape_name': category_name,
-                            'payload': payload
-                        })
-                        self.logger.debug(f"Found etape/category (li method): {category_name} with payload: {payload}")
-
-        # Second try: Look for <select> elements with <option> children (new approach)
-        if not etape_stages:
-            select_elements = soup.find_all('select')
-
-            for select in select_elements:
-                options = select.find_all('option')
-
-                for option in options:
-                    option_text = option.get_text().strip()
-                    option_value = option.get('value', '')
-
-                    # Check if this option contains "Etape" or matches category pattern
-                    if is_category_or_etape(option_text):
-                        if option_value:
-                            category_name = extract_category_name(option_text)
-                            etape_stages.append({
-                                'etape_name': category_name,
-                                'payload': option_value
-                            })
-                            self.logger.debug(f"Found etape/category (select method): {category_name} with payload: {option_value}")
-
-        return etape_stages
-
-    def _find_etape_results_table(self, soup, payload: str):
+        except Exception as e:
+            self.logger.error(f"Error processing race {race_url}: {e}")
+            self.stats['errors'] += 1
+            return False
+    
+    def _process_race_participants(self, results: Dict[str, Any], race_id: str,
+                                   conn: Optional[sqlite3.Connection] = None) -> int:
         """
-        Find the results table for a specific etape payload
+        Save participants extracted from a results table
 
         Args:
-            soup: BeautifulSoup object of the race page
-            payload: The payload identifier (e.g., "ranking1")
+            results: Extracted results (see _extract_results)
+            race_id: Race ID for database storage
+            conn: Optional connection holding the race's write transaction
 
         Returns:
-            BeautifulSoup table element or None
+            Number of participants successfully added
         """
-        # Look for a div with id or class containing the payload
-        target_div = None
-
-        # Try to find div with id containing payload
-        target_div = soup.find('div', id=payload)
-
-        # If not found by id, try to find by class or data attributes
-        if not target_div:
-            target_div = soup.find('div', class_=payload)
-
-        # If still not found, try data attributes or other selectors
-        if not target_div:
-            target_div = soup.find('div', attrs={'data-category': payload})
-
-        # If still not found, search for divs containing the payload in any attribute
-        if not target_div:
-            for div in soup.find_all('div'):
-                div_attrs = div.attrs
-                for attr_name, attr_value in div_attrs.items():
-                    if isinstance(attr_value, str) and payload in attr_value:
-                        target_div = div
-                        break
-                    elif isinstance(attr_value, list) and any(payload in val for val in attr_value):
-                        target_div = div
-                        break
-                if target_div:
-                    break
-
-        if target_div:
-            self.logger.debug(f"Found target div for payload: {payload}")
+        participants = results['participants']
+        self.stats['errors'] += results['errors']
 
-            # Look for results table within this div using existing selectors
-            from backend.config.constants import RESULTS_TABLE_SELECTORS
+        if not self.store_raw_data:
+            for participant_data in participants:
+                participant_data['raw_data'] = None
 
-            for selector in RESULTS_TABLE_SELECTORS:
-                table = target_div.select_one(selector)
-                if table:
-                    self.logger.debug(f"Found results table with selector: {selector}")
-                    return table
+        participants_added = self.db.add_race_participants(
+            race_id, participants, race_participant_count=results['total_participants'], conn=conn
+        )
 
-            # If no table found with standard selectors, try generic table search
-            table = target_div.find('table')
-            if table:
-                self.logger.debug("Found results table with generic table selector")
-                return table
+        failed = len(participants) - participants_added
+        if failed:
+            self.logger.warning(f"Failed to save {failed} participants for race {race_id}")
+            self.stats['errors'] += failed
 
-        self.logger.warning(f"No results table found for payload: {payload}")
-        return None
+        self.stats['new_results'] += participants_added
+        return participants_added
 
     def _process_card_date(self, raw_date: str) -> str:
         """
@@ -505,6 +832,8 @@ class OptimizedCyclingScraperDB:
 
         Examples:
         - "u 25 Maiau 26 Mai2024" -> "25 mai 2024"
+        - "Du 30 déc. au 2 janv. 2025" -> "30 décembre 2024"
+        - "Du 25 mai 2024 au 26 mai 2024" -> "25 mai 2024"
         - "31 mai 2025" -> "31 mai 2025"
 
         Args:
@@ -516,39 +845,40 @@ class OptimizedCyclingScraperDB:
         if not raw_date:
             return ""
 
-        import re
+        # Fast path: already a well-formed single day date such as "31 mai 2025"
+        if (len(raw_date) < 20 and raw_date[0].isdigit() and raw_date[-1].isdigit()
+                and ' ' in raw_date and ' '.join(raw_date.split()) == raw_date
+                and 'au' not in raw_date.lower()):
+            return convert_abbreviated_months_to_french(raw_date)
 
         # Handle multi-day format without proper spacing: "u 25 Maiau 26 Mai2024"
         # Look for pattern: optional "u " + day + month + "au" + day + month + year
-        multi_day_no_space_pattern = r'u?\s*(\d{1,2}\s+\w+?)au\s*\d{1,2}\s+\w+?(\d{4})'
-        match = re.search(multi_day_no_space_pattern, raw_date, re.IGNORECASE)
+        match = _MULTI_DAY_NOSPACE_RE.search(raw_date)
 
         if match:
             first_day_month = match.group(1).strip()
-            year = match.group(2).strip()
+            year = _multi_day_start_year(raw_date, match)
             processed_date = f"{first_day_month} {year}"
-            self.logger.debug(f"Extracted first day from multi-day race (no-space): '{raw_date}' -> '{processed_date}'")
+            self.logger.debug("Extracted first day from multi-day race (no-space): '%s' -> '%s'", raw_date, processed_date)
         else:
-            # Handle standard multi-day format: "Du 25 Mai au 26 Mai 2024" (with spaces)
-            multi_day_pattern = r'Du\s+(\d{1,2}\s+\w+).*?(\d{4})'
-            match = re.search(multi_day_pattern, raw_date, re.IGNORECASE)
+            # Handle standard multi-day format: "Du 25 Mai au 26 Mai 2024",
+            # "Du 30 déc. au 2 janv. 2025", "Du 25 mai 2024 au 26 mai 2024"
+            match = _MULTI_DAY_RE.search(raw_date)
 
             if match:
                 first_day = match.group(1).strip()
-                year = match.group(2).strip()
+                year = _multi_day_start_year(raw_date, match)
                 processed_date = f"{first_day} {year}"
-                self.logger.debug(f"Extracted first day from multi-day race: '{raw_date}' -> '{processed_date}'")
+                self.logger.debug("Extracted first day from multi-day race: '%s' -> '%s'", raw_date, processed_date)
             else:
                 # Single day format, just clean up
                 processed_date = raw_date.strip()
                 # Remove extra spaces
-                processed_date = re.sub(r'\s+', ' ', processed_date)
+                processed_date = _WS_RE.sub(' ', processed_date)
 
-        # Import and use the convert function
-        from backend.utils.scraper_utils import convert_abbreviated_months_to_french
         final_date = convert_abbreviated_months_to_french(processed_date)
 
-        self.logger.debug(f"Final processed date: '{raw_date}' -> '{final_date}'")
+        self.logger.debug("Final processed date: '%s' -> '%s'", raw_date, final_date)
         return final_date
 
     def discover_all_races(self) -> List[str]:
@@ -597,20 +927,39 @@ class OptimizedCyclingScraperDB:
             self.logger.info(f"Starting to scrape {len(race_urls)} races...")
             
             with ScrapingProgressLogger(self.logger, "race scraping", len(race_urls)) as progress:
-                for i, race_url in enumerate(race_urls, 1):
-                    success = self.scrape_race_details(race_url)
+                # Pages being parsed in the background, saved in fetch order
+                pending = deque()
+
+                for batch_start in range(0, len(race_urls), MAX_CONCURRENT_REQUESTS):
+                    batch = race_urls[batch_start:batch_start + MAX_CONCURRENT_REQUESTS]
                     
-                    # Log progress based on success
-                    if success:
-                        progress.log_item(f"race {i}", True)
-                    else:
-                        if race_url in self.processed_urls:
-                            progress.log_skip(f"race {i}", "already exists")
+                    # Fetch the pages of the batch concurrently over the shared session
+                    to_fetch = [race_url for race_url in batch if self._needs_fetch(race_url)]
+                    responses = dict(zip(to_fetch, fetch_many(self.session, to_fetch, executor=self._fetch_pool)))
+                    
+                    for i, race_url in enumerate(batch, batch_start + 1):
+                        html = None
+                        if race_url in responses:
+                            html = self._response_content(race_url, responses.pop(race_url))
+                        
+                        if html is None:
+                            self._log_race_progress(progress, i, race_url, False)
                         else:
-                            progress.log_item(f"race {i}", False)
+                            pending.append((i, race_url, self._submit_parse(html)))
+                        
+                        # Save the oldest parsed pages once the pipeline is full
+                        while len(pending) > PARSE_WORKERS:
+                            index, url, parsed_future = pending.popleft()
+                            success = self._store_race_page(url, parsed_future)
+                            self._log_race_progress(progress, index, url, success)
                     
                     # Rate limiting
                     time.sleep(RATE_LIMIT_DELAY)
+                
+                while pending:
+                    index, url, parsed_future = pending.popleft()
+                    success = self._store_race_page(url, parsed_future)
+                    self._log_race_progress(progress, index, url, success)
             
             # Update scraping metadata
             self._update_scraping_metadata()
@@ -627,6 +976,16 @@ class OptimizedCyclingScraperDB:
             self.print_summary()
             raise
     
+    def _log_race_progress(self, progress: ScrapingProgressLogger, index: int,
+                           race_url: str, success: bool) -> None:
+        """Log progress for a single race based on its outcome"""
+        if success:
+            progress.log_item(f"race {index}", True)
+        elif race_url in self.processed_urls:
+            progress.log_skip(f"race {index}", "already exists")
+        else:
+            progress.log_item(f"race {index}", False)
+    
     def _update_scraping_metadata(self) -> None:
         """Update scraping metadata in database"""
         try:
@@ -660,6 +1019,13 @@ class OptimizedCyclingScraperDB:
         if self.session:
             self.session.close()
         
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._worker_log_listener.stop()
+        
+        if self._fetch_pool is not None:
+            self._fetch_pool.shutdown()
+        
         if exc_type is not None:
             self.logger.error(f"Scraper exiting due to exception: {exc_val}")
 
@@ -677,12 +1043,20 @@ def main():
     parser.add_argument('--db-path', '-d',
                        default=DEFAULT_DB_PATH,
                        help=f'Database path (default: {DEFAULT_DB_PATH})')
+    parser.add_argument('--no-raw-data',
+                       action='store_true',
+                       help='Do not store raw table cells for each participant')
+    parser.add_argument('--no-cache',
+                       action='store_true',
+                       help='Do not use the on-disk HTTP cache for race pages')
     
     # Support legacy usage: python script.py [db_path] [region]
     if len(sys.argv) > 1 and not sys.argv[1].startswith('-'):
         # Legacy mode: first arg is db_path, second is region
         db_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DB_PATH
         region = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_REGION
+        store_raw_data = True
+        http_cache = True
         
         # Validate region
         if region not in AVAILABLE_REGIONS:
@@ -694,6 +1068,8 @@ def main():
         args = parser.parse_args()
         db_path = args.db_path
         region = args.region
+        store_raw_data = not args.no_raw_data
+        http_cache = not args.no_cache
     
     # Initialize logging
     logger = get_scraper_logger()
@@ -704,7 +1080,7 @@ def main():
         logger.info("This may take a while depending on the number of races")
         
         # Use context manager for proper cleanup
-        with OptimizedCyclingScraperDB(db_path, region) as scraper:
+        with OptimizedCyclingScraperDB(db_path, region, store_raw_data, http_cache) as scraper:
             scraper.scrape_all_races()
         
         logger.info("Scraping completed successfully!")
@@ -3,12 +3,70 @@ Logging configuration and utilities
 Centralized logging setup for the Race Cycling History App
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from typing import Optional
+import time
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional, Tuple
 from pathlib import Path
 
-from backend.config.constants import LOG_LEVEL, LOG_FORMAT, LOG_DATE_FORMAT
+from backend.config.constants import (
+    LOG_LEVEL, LOG_FORMAT, LOG_DATE_FORMAT, LOG_FILE_BUFFER_SIZE, LOG_FLUSH_INTERVAL
+)
+
+
+# Buffered file handlers of this process, written out before a fork so that a
+# child process never inherits (and later writes again) unflushed parent lines
+_buffered_handlers = weakref.WeakSet()
+
+
+def _flush_buffered_handlers() -> None:
+    for handler in list(_buffered_handlers):
+        handler.flush_buffer()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=_flush_buffered_handlers)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler writing through a large buffer
+
+    logging.FileHandler flushes after every record; this one only flushes when
+    LOG_FLUSH_INTERVAL has passed since the last flush, on close and before a
+    fork. Behind a queue, the listener also flushes it once logging goes idle.
+    """
+    
+    def __init__(self, filename: str, mode: str = 'a', encoding: Optional[str] = None,
+                 buffer_size: int = LOG_FILE_BUFFER_SIZE,
+                 flush_interval: float = LOG_FLUSH_INTERVAL):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        super().__init__(filename, mode=mode, encoding=encoding)
+        _buffered_handlers.add(self)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+    
+    def flush(self):
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush_buffer()
+    
+    def flush_buffer(self):
+        """Write out the buffer now, whatever the time since the last flush"""
+        self._last_flush = time.monotonic()
+        super().flush()
+    
+    def close(self):
+        # Always write out what is left in the buffer
+        self._last_flush = float('-inf')
+        super().close()
 
 
 def setup_logging(
@@ -42,13 +100,14 @@ def setup_logging(
     
     # Create formatter
     formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+    handlers = []
     
     # Console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         console_handler.setLevel(log_level)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler
     if log_file:
@@ -56,14 +115,107 @@ def setup_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file)
+        file_handler = BufferedFileHandler(log_file)
         file_handler.setFormatter(formatter)
         file_handler.setLevel(log_level)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    if handlers:
+        _attach_queue_handler(logger, handlers)
     
     return logger
 
 
+def _attach_queue_handler(logger: logging.Logger, handlers: List[logging.Handler]) -> None:
+    """
+    Route a logger through a queue so console and file writes happen on a listener thread
+    
+    Args:
+        logger: Logger to configure
+        handlers: Handlers doing the actual output
+    """
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    
+    listener = _FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+class _FlushingQueueListener(QueueListener):
+    """
+    QueueListener that also flushes its handlers whenever the queue stays idle
+    
+    Buffered file handlers only flush when a record arrives after their flush
+    interval, so without this the end of a burst of records would stay in the
+    buffer until the next record or exit.
+    """
+    
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, timeout=LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    if isinstance(handler, BufferedFileHandler):
+                        handler.flush_buffer()
+                    else:
+                        handler.flush()
+
+
+class _ParentLoggerHandler(logging.Handler):
+    """Hand records received from worker processes to the logger of the same name"""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        logger = logging.getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+
+
+def start_worker_log_listener(mp_context) -> Tuple[object, QueueListener]:
+    """
+    Collect log records sent by worker processes (see init_worker_logging)
+    
+    Workers never write to this process's handlers themselves; their records go
+    through a multiprocessing queue and are logged here by a listener thread.
+    
+    Args:
+        mp_context: Multiprocessing context the workers are started with
+        
+    Returns:
+        Tuple of (queue to pass to the workers, running listener to stop once they are done)
+    """
+    log_queue = mp_context.Queue(-1)
+    listener = QueueListener(log_queue, _ParentLoggerHandler())
+    listener.start()
+    return log_queue, listener
+
+
+def init_worker_logging(log_queue, level: int) -> None:
+    """
+    Process pool initializer sending every record of the worker to the parent process
+    
+    Args:
+        log_queue: Queue returned by start_worker_log_listener
+        level: Lowest level forwarded to the parent
+    """
+    # Drop handlers inherited from a forked parent, whose listener threads do not exist here
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with default configuration
@@ -87,12 +239,15 @@ class ScrapingProgressLogger:
         self.current = 0
         self.success_count = 0
         self.error_count = 0
+        # Per-item debug lines, emitted as one record at each milestone
+        self._debug_lines = []
     
     def __enter__(self):
         self.logger.info(f"Starting {self.operation} - {self.total} items to process")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self._flush_debug()
         if exc_type is None:
             self.logger.info(
                 f"Completed {self.operation} - "
@@ -112,13 +267,15 @@ class ScrapingProgressLogger:
         
         if success:
             self.success_count += 1
-            self.logger.debug(f"{item_name} ({self.current}/{self.total})")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self._debug_lines.append(f"{item_name} ({self.current}/{self.total})")
         else:
             self.error_count += 1
             self.logger.warning(f"{item_name} ({self.current}/{self.total})")
         
         # Log milestone progress
         if self.current % 10 == 0 or self.current == self.total:
+            self._flush_debug()
             percentage = (self.current / self.total * 100) if self.total > 0 else 0
             self.logger.info(
                 f"Progress: {self.current}/{self.total} ({percentage:.1f}%) - "
@@ -133,6 +290,12 @@ class ScrapingProgressLogger:
             skip_msg += f" ({reason})"
         skip_msg += f" ({self.current}/{self.total})"
         self.logger.debug(skip_msg)
+    
+    def _flush_debug(self):
+        """Emit the buffered per-item debug lines as a single record"""
+        if self._debug_lines:
+            self.logger.debug("\n".join(self._debug_lines))
+            self._debug_lines = []
 
 
 def log_summary(logger: logging.Logger, stats: dict, operation: str = "Operation"):
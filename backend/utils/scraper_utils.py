@@ -4,18 +4,34 @@ Shared utilities used across different scraper implementations
 """
 
 import re
-import time
 import hashlib
 import logging
-from typing import Optional, List, Dict, Any
-from urllib.parse import urlparse, urljoin
+from functools import lru_cache
+from itertools import takewhile
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
+from urllib.parse import urlparse, urljoin, urlencode
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = 'lxml'
+except ImportError:  # lxml is optional, BeautifulSoup then uses the pure-Python parser
+    BS4_PARSER = 'html.parser'
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional, sessions are then uncached
+    requests_cache = None
 
 from backend.config.constants import (
     FRENCH_DATE_PATTERNS, GENERIC_DATE_PATTERNS, DEFAULT_DATE,
     CLUB_NUMBER_PATTERN, HEADER_KEYWORDS, MIN_PARTICIPANT_CELLS,
-    REQUEST_TIMEOUT, MAX_RETRIES, RETRY_BACKOFF_FACTOR,
+    REQUEST_TIMEOUT, MAX_RETRIES, RETRY_BACKOFF_FACTOR, MAX_CONCURRENT_REQUESTS, HTTP_CACHE_EXPIRE,
     DATE_SELECTORS, RACE_ID_PREFIX, RACE_ID_HASH_LENGTH,
     ERROR_MESSAGES
 )
@@ -23,12 +39,63 @@ from backend.config.constants import (
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Abbreviated French month names and their full form
+FRENCH_ABBREVIATED_TO_FULL = {
+    'jan': 'janvier',
+    'fév': 'février',
+    'fev': 'février',  # Handle without accent
+    'mar': 'mars',
+    'avr': 'avril',
+    'mai': 'mai',
+    'jun': 'juin',
+    'juin': 'juin',
+    'jui': 'juillet',
+    'jul': 'juillet',  # Alternative abbreviation
+    'juil': 'juillet',  # Alternative abbreviation
+    'aoû': 'août',
+    'aou': 'août',     # Handle without accent
+    'août': 'août',     # Handle without accent
+    'sep': 'septembre',
+    'sept': 'septembre',
+    'oct': 'octobre',
+    'nov': 'novembre',
+    'déc': 'décembre',
+    'dec': 'décembre'  # Handle without accent
+}
+
+# Precompiled patterns used on every participant row and race page
+_CLUB_NUM_RE = re.compile(CLUB_NUMBER_PATTERN)
+_MONTH_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(abbrev) for abbrev in FRENCH_ABBREVIATED_TO_FULL) + r')\b',
+    re.IGNORECASE
+)
+# Paginated listing pages, which change as races are published and are never cached
+_LISTING_URL_RE = re.compile(r'[?&]_pagination=')
+
 
 class ScrapingError(Exception):
     """Custom exception for scraping-related errors"""
     pass
 
 
+class _ExponentialRetry(Retry):
+    """Retry waiting RETRY_BACKOFF_FACTOR ** n seconds before retry n + 1 (1s, 2s, ...)
+
+    urllib3 does not wait before the first retry and doubles backoff_factor
+    from the second one on, so its schedule cannot start at 1s.
+    """
+
+    def get_backoff_time(self) -> float:
+        # Only the last run of consecutive errors counts, redirects reset it
+        consecutive_errors = len(list(
+            takewhile(lambda history: history.redirect_location is None, reversed(self.history))
+        ))
+        if consecutive_errors == 0:
+            return 0
+        return float(RETRY_BACKOFF_FACTOR ** (consecutive_errors - 1))
+
+
+@lru_cache(maxsize=4096)
 def clean_club_name(club_raw: str) -> Optional[str]:
     """
     Remove leading numbers from club names
@@ -43,10 +110,11 @@ def clean_club_name(club_raw: str) -> Optional[str]:
         return None
     
     # Remove leading numbers and spaces
-    cleaned = re.sub(CLUB_NUMBER_PATTERN, '', club_raw.strip())
+    cleaned = _CLUB_NUM_RE.sub('', club_raw.strip())
     return cleaned if cleaned else club_raw
 
 
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """
     Normalize text by removing extra whitespace
@@ -60,7 +128,8 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
     
-    return re.sub(r'\s+', ' ', text).strip()
+    # str.split() with no argument splits on whitespace runs and drops the ends
+    return ' '.join(text.split())
 
 
 def is_header_entry(first_name: str, last_name: str) -> bool:
@@ -74,11 +143,10 @@ def is_header_entry(first_name: str, last_name: str) -> bool:
     Returns:
         True if this appears to be a header entry
     """
-    first_lower = first_name.lower() if first_name else ""
-    last_lower = last_name.lower() if last_name else ""
-    
-    return (first_lower in HEADER_KEYWORDS or 
-            last_lower in HEADER_KEYWORDS)
+    return bool(
+        (first_name and first_name.lower() in HEADER_KEYWORDS) or
+        (last_name and last_name.lower() in HEADER_KEYWORDS)
+    )
 
 
 def convert_abbreviated_months_to_french(date_text: str) -> str:
@@ -91,36 +159,8 @@ def convert_abbreviated_months_to_french(date_text: str) -> str:
     Returns:
         Date text with French full month names (e.g. "septembre")
     """
-    french_abbreviated_to_full = {
-        'jan': 'janvier',
-        'fév': 'février',
-        'fev': 'février',  # Handle without accent
-        'mar': 'mars',
-        'avr': 'avril',
-        'mai': 'mai',
-        'jun': 'juin',
-        'juin': 'juin',
-        'jui': 'juillet',
-        'jul': 'juillet',  # Alternative abbreviation
-        'juil': 'juillet',  # Alternative abbreviation
-        'aoû': 'août',
-        'aou': 'août',     # Handle without accent
-        'août': 'août',     # Handle without accent
-        'sep': 'septembre',
-        'sept': 'septembre',
-        'oct': 'octobre',
-        'nov': 'novembre',
-        'déc': 'décembre',
-        'dec': 'décembre'  # Handle without accent
-    }
-
-    # Convert the date text
-    converted_text = date_text
-    for fr_abbrev, fr_full in french_abbreviated_to_full.items():
-        # Case-insensitive replacement
-        converted_text = re.sub(r'\b' + re.escape(fr_abbrev) + r'\b', fr_full, converted_text, flags=re.IGNORECASE)
-
-    return converted_text
+    # Single pass over the text with one alternation of all abbreviations
+    return _MONTH_RE.sub(lambda match: FRENCH_ABBREVIATED_TO_FULL[match.group(1).lower()], date_text)
 
 
 def extract_race_date(soup: BeautifulSoup) -> str:
@@ -138,35 +178,55 @@ def extract_race_date(soup: BeautifulSoup) -> str:
     
     if date_elem:
         date_text = date_elem.get_text().strip()
-        logger.debug(f"Found date element: {date_text}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Found date element: %s", date_text)
 
         # Convert abbreviated English months to French if present
         date_text = convert_abbreviated_months_to_french(date_text)
-        logger.debug(f"Date after month conversion: {date_text}")
+        if debug:
+            logger.debug("Date after month conversion: %s", date_text)
 
         # Try French date patterns first
         for pattern in FRENCH_DATE_PATTERNS:
-            match = re.search(pattern, date_text, re.IGNORECASE)
+            match = pattern.search(date_text)
             if match:
-                logger.debug(f"Found French date: {match.group(1)}")
+                logger.debug("Found French date: %s", match.group(1))
                 return match.group(1)
 
         # Try generic date patterns
         for pattern in GENERIC_DATE_PATTERNS:
-            match = re.search(pattern, date_text)
+            match = pattern.search(date_text)
             if match:
-                logger.debug(f"Found date: {match.group(1)}")
+                logger.debug("Found date: %s", match.group(1))
                 return match.group(1)
 
         # If no pattern matches, return the raw text as fallback
         if date_text:
-            logger.debug(f"Using raw date text: {date_text}")
+            logger.debug("Using raw date text: %s", date_text)
             return date_text
     
     logger.warning("No date found in header-race__date div, using default")
     return DEFAULT_DATE
 
 
+@lru_cache(maxsize=4096)
+def _split_race_url(race_url: str) -> Tuple[str, str]:
+    """
+    Get the path and fragment of a race URL
+    
+    Race URLs recur across listing pages and stages, so they are parsed once.
+    
+    Args:
+        race_url: URL of the race page
+        
+    Returns:
+        Tuple of (path, fragment)
+    """
+    parsed_url = urlparse(race_url)
+    return parsed_url.path, parsed_url.fragment
+
+
 def generate_race_id(race_name: str, race_date: str, race_url: str) -> str:
     """
     Generate a unique race ID based on URL, name, and date
@@ -180,8 +240,7 @@ def generate_race_id(race_name: str, race_date: str, race_url: str) -> str:
         Unique race ID string
     """
     # Extract unique identifier from URL (preferred method)
-    parsed_url = urlparse(race_url)
-    url_path = parsed_url.path
+    url_path, fragment = _split_race_url(race_url)
 
     if url_path and '/resultats/' in url_path:
         # Extract race ID from URL (e.g., /resultats/race-name-slug)
@@ -190,18 +249,18 @@ def generate_race_id(race_name: str, race_date: str, race_url: str) -> str:
             url_id = path_parts[-1]  # Last part of URL
 
             # Include fragment (hash) if present for multi-stage races
-            if parsed_url.fragment:
-                url_id = f"{url_id}_{parsed_url.fragment}"
+            if fragment:
+                url_id = f"{url_id}_{fragment}"
 
             race_id = f"{RACE_ID_PREFIX}{url_id}"
-            logger.debug(f"Generated URL-based race ID: {race_id}")
+            logger.debug("Generated URL-based race ID: %s", race_id)
             return race_id
 
     # Fallback: hash name and date (include URL for uniqueness)
     content = f"{race_name}_{race_date}_{race_url}".encode('utf-8')
     hash_short = hashlib.md5(content).hexdigest()[:RACE_ID_HASH_LENGTH]
     race_id = f"{RACE_ID_PREFIX}{hash_short}"
-    logger.debug(f"Generated hash-based race ID: {race_id}")
+    logger.debug("Generated hash-based race ID: %s", race_id)
     return race_id
 
 
@@ -219,42 +278,76 @@ def extract_rank(rank_text: str, fallback_rank: int = 0) -> int:
     if not rank_text:
         return fallback_rank
     
-    # Clean up rank (extract first number found)
-    rank_match = re.search(r'\d+', rank_text.strip())
-    return int(rank_match.group()) if rank_match else fallback_rank
+    # Most ranks are plain numbers
+    if rank_text.isdecimal():
+        return int(rank_text)
+    
+    # Otherwise extract the first run of digits ("12.", "DSQ 3", ...)
+    length = len(rank_text)
+    start = 0
+    while start < length and not rank_text[start].isdecimal():
+        start += 1
+    end = start
+    while end < length and rank_text[end].isdecimal():
+        end += 1
+    return int(rank_text[start:end]) if end > start else fallback_rank
 
 
-def get_page_with_retry(session: requests.Session, url: str, 
-                       retries: int = MAX_RETRIES) -> Optional[requests.Response]:
+def get_page_with_retry(session: requests.Session, url: str) -> Optional[requests.Response]:
     """
-    Get page content with retry logic and exponential backoff
+    Get page content, retrying through the session's retry adapter
+    
+    Connection errors and 5xx responses are retried with exponential backoff by
+    the adapter mounted in create_session, on the same connection pool.
     
     Args:
-        session: Requests session to use
+        session: Requests session to use (see create_session)
         url: URL to fetch
-        retries: Maximum number of retry attempts
         
     Returns:
         Response object or None if all retries failed
     """
-    for attempt in range(retries):
-        try:
-            logger.debug(f"Fetching {url} (attempt {attempt + 1}/{retries})")
-            response = session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            return response
-            
-        except requests.RequestException as e:
-            logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-            
-            if attempt < retries - 1:
-                # Exponential backoff
-                sleep_time = RETRY_BACKOFF_FACTOR ** attempt
-                logger.debug(f"Retrying in {sleep_time} seconds...")
-                time.sleep(sleep_time)
-            else:
-                logger.error(f"All {retries} attempts failed for {url}")
-                return None
+    try:
+        logger.debug("Fetching %s", url)
+        response = session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response
+        
+    except requests.RequestException as e:
+        logger.error(f"Request failed for {url}: {e}")
+        return None
+
+
+def fetch_many(session: requests.Session, urls: List[str],
+               max_workers: int = MAX_CONCURRENT_REQUESTS,
+               executor: Optional[Executor] = None) -> List[Optional[requests.Response]]:
+    """
+    Fetch several pages concurrently over a shared session
+    
+    Each page goes through get_page_with_retry, so retries and backoff are
+    handled per URL while the other requests keep going.
+    
+    Args:
+        session: Requests session to use
+        urls: URLs to fetch
+        max_workers: Maximum number of requests in flight
+        executor: Optional long-lived executor to run the requests on, instead
+            of starting a thread pool for this call
+        
+    Returns:
+        Response objects (or None for failed fetches) in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    if executor is not None:
+        return list(executor.map(lambda url: get_page_with_retry(session, url), urls))
+    
+    if len(urls) == 1 or max_workers <= 1:
+        return [get_page_with_retry(session, url) for url in urls]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(lambda url: get_page_with_retry(session, url), urls))
 
 
 def find_results_table(soup: BeautifulSoup, 
@@ -272,7 +365,7 @@ def find_results_table(soup: BeautifulSoup,
     for selector in selectors:
         table = soup.select_one(selector)
         if table:
-            logger.debug(f"Found results table with selector: {selector}")
+            logger.debug("Found results table with selector: %s", selector)
             return table
     
     logger.warning("No results table found with any selector")
@@ -295,10 +388,20 @@ def extract_participant_data(row) -> Optional[Dict[str, Any]]:
         return None
     
     # Extract raw data from all cells
-    raw_data = [cell.get_text().strip() for cell in cells]
+    return extract_participant_from_cells([cell.get_text().strip() for cell in cells])
+
+
+def extract_participant_from_cells(raw_data: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Extract participant data from the stripped cell texts of a table row
     
-    # Skip if not enough data
-    if len(raw_data) < 4:
+    Args:
+        raw_data: Text of each cell of the row
+        
+    Returns:
+        Dictionary with participant data or None if invalid
+    """
+    if len(raw_data) < MIN_PARTICIPANT_CELLS:
         return None
     
     # Extract basic information
@@ -337,20 +440,47 @@ def extract_participant_data(row) -> Optional[Dict[str, Any]]:
     }
 
 
-def create_session(user_agent: str) -> requests.Session:
+def create_session(user_agent: str, cache_name: Optional[str] = None) -> requests.Session:
     """
     Create a configured requests session
     
     Args:
         user_agent: User agent string to use
+        cache_name: Optional path of an on-disk SQLite HTTP cache. Race pages are
+            served from it and revalidated (ETag/Last-Modified) once expired;
+            listing pages are never cached. Ignored if requests-cache is missing.
         
     Returns:
         Configured requests session
     """
-    session = requests.Session()
+    if cache_name and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name,
+            backend='sqlite',
+            expire_after=HTTP_CACHE_EXPIRE,
+            urls_expire_after={_LISTING_URL_RE: requests_cache.DO_NOT_CACHE},
+            allowable_methods=('GET',),
+            stale_if_error=True
+        )
+    else:
+        session = requests.Session()
     session.headers.update({
-        'User-Agent': user_agent
+        'User-Agent': user_agent,
+        'Accept': 'text/html,application/xhtml+xml',
+        # Every compression urllib3 can decode here (br/zstd when brotli/zstandard are installed)
+        'Accept-Encoding': ACCEPT_ENCODING
     })
+    
+    # Retry failed requests with exponential backoff (1s, 2s, ...) without
+    # leaving the connection pool; GET is retried by default
+    retry = _ExponentialRetry(
+        total=MAX_RETRIES - 1,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     return session
 
 
@@ -366,15 +496,8 @@ def build_search_url(base_url: str, params: Dict[str, str], page: int = 1) -> st
     Returns:
         Complete search URL
     """
-    # Add pagination parameter
-    params = params.copy()
-    params['_pagination'] = str(page)
-    
-    # Build query string
-    query_parts = [f"{k}={v}" for k, v in params.items()]
-    query_string = "&".join(query_parts)
-    
-    return f"{base_url}?{query_string}"
+    # Add pagination parameter and URL-encode the query string
+    return f"{base_url}?{urlencode({**params, '_pagination': str(page)})}"
 
 
 def validate_race_data(race_data: Dict[str, Any]) -> bool: